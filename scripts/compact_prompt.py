@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+"""
+Token-budget report for the system prompt
+
+The system prompt is sent on every non-cached LLM call, so its token
+count is a direct per-call cost. Run this after editing
+prompts.SYSTEM_PROMPT to see the total and per-section token counts and
+find where the budget is going; tests/test_prompts.py enforces the
+overall budget.
+
+Requires tiktoken (not a runtime dependency): pip install tiktoken
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from prompts import SYSTEM_PROMPT
+
+
+def _sections(prompt: str):
+    """Split the prompt into (title, text) pairs on top-level headings"""
+    title = "(preamble)"
+    lines = []
+    for line in prompt.splitlines(keepends=True):
+        if line.startswith("# "):
+            if lines:
+                yield title, "".join(lines)
+            title = line.strip().lstrip("# ")
+            lines = [line]
+        else:
+            lines.append(line)
+    if lines:
+        yield title, "".join(lines)
+
+
+def main():
+    try:
+        import tiktoken
+    except ImportError:
+        sys.exit("tiktoken is required for token counts: pip install tiktoken")
+
+    encoding = tiktoken.encoding_for_model("gpt-4o")
+
+    total = len(encoding.encode(SYSTEM_PROMPT))
+    print(f"SYSTEM_PROMPT: {total} tokens, {len(SYSTEM_PROMPT.encode('utf-8'))} bytes\n")
+
+    for title, text in _sections(SYSTEM_PROMPT):
+        tokens = len(encoding.encode(text))
+        print(f"  {tokens:5d}  {title}")
+
+
+if __name__ == "__main__":
+    main()
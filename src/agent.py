@@ -8,11 +8,29 @@ Core agent that:
 4. Handles errors intelligently
 """
 
+import asyncio
 import json
-from typing import Dict, Optional, List
+import random
+import re
+from collections import deque
+from typing import AsyncIterator, Deque, Dict, Optional, List
 from datetime import datetime
 
-from config import Config, BusinessRules
+import orjson
+
+# SDK imports paid once at module load instead of on the first user turn;
+# each provider is optional, matching which API key is configured
+try:
+    from openai import AsyncOpenAI, RateLimitError as OpenAIRateLimitError
+except ImportError:
+    AsyncOpenAI = None
+
+try:
+    from anthropic import AsyncAnthropic, RateLimitError as AnthropicRateLimitError
+except ImportError:
+    AsyncAnthropic = None
+
+from config import CONFIG, BusinessRules
 from prompts import (
     get_system_prompt,
     get_music_validation_prompt,
@@ -21,12 +39,140 @@ from prompts import (
 )
 from validators import CampaignValidator, MusicValidator, format_validation_errors
 from api_client import TikTokAPIClient
+from llm_cache import LLMCache
 from oauth_manager import TikTokOAuthManager
 
 
+# Process-wide cap on in-flight LLM calls: staying just under the provider
+# rate limit beats blowing past it and thrashing on 429 retries
+_LLM_SEM = asyncio.Semaphore(CONFIG.llm_max_concurrent)
+
+# Pinned at import; diagnostic branches also check __debug__ so that
+# python -O strips them from the bytecode entirely
+DEBUG = CONFIG.debug
+
+# JSON object inside a (possibly ```json-tagged) markdown fence
+_FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+
+# Decoder used to find the first complete JSON object in free-form text
+_JSON_DECODER = json.JSONDecoder()
+
+# Start of the user-visible field inside the streamed JSON reply
+_RESPONSE_FIELD_RE = re.compile(r'"conversation_response"\s*:\s*"')
+
+# Bare greetings that get a canned reply instead of an LLM round-trip
+_GREETING_RE = re.compile(r"^(hi|hello|hey)\s*[.!]*$", re.IGNORECASE)
+
+
+class _TopLevelJsonTracker:
+    """Detects when the first top-level JSON object in a token stream closes"""
+
+    def __init__(self):
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+        self.started = False
+
+    def feed(self, chunk: str) -> bool:
+        """Consume a chunk; return True once the object has closed"""
+        for char in chunk:
+            if self.escaped:
+                self.escaped = False
+            elif char == "\\":
+                self.escaped = True
+            elif char == '"':
+                self.in_string = not self.in_string
+            elif not self.in_string:
+                if char == "{":
+                    self.depth += 1
+                    self.started = True
+                elif char == "}":
+                    self.depth -= 1
+                    if self.started and self.depth == 0:
+                        return True
+        return False
+
+
+# JSON single-character escapes, decoded during incremental extraction
+_JSON_ESCAPES = {
+    "n": "\n", "t": "\t", "r": "\r", "b": "\b", "f": "\f",
+    '"': '"', "\\": "\\", "/": "/",
+}
+
+
+def _extract_partial_response(text: str) -> str:
+    """
+    Extract the (possibly still-growing) conversation_response string
+    from a partially streamed JSON reply.
+
+    Decoding must match what orjson produces for the final parse, or the
+    caller's emitted-character count drifts and the reconciliation tail
+    re-emits or truncates text. Escapes that are incomplete (split
+    across chunks) or malformed stop the extraction there; later chunks
+    or the final parse pick the rest up.
+    """
+    match = _RESPONSE_FIELD_RE.search(text)
+    if not match:
+        return ""
+
+    chars = []
+    i = match.end()
+    end = len(text)
+
+    while i < end:
+        char = text[i]
+        if char == '"':
+            break
+        if char != "\\":
+            chars.append(char)
+            i += 1
+            continue
+
+        # Escape sequence; wait for more chunks if it's still incomplete
+        if i + 1 >= end:
+            break
+        esc = text[i + 1]
+        if esc != "u":
+            chars.append(_JSON_ESCAPES.get(esc, esc))
+            i += 2
+            continue
+
+        if i + 6 > end:
+            break
+        try:
+            code_point = int(text[i + 2:i + 6], 16)
+        except ValueError:
+            break
+        if 0xDC00 <= code_point <= 0xDFFF:
+            # Unpaired low surrogate: malformed, leave it to the final parse
+            break
+        if 0xD800 <= code_point <= 0xDBFF:
+            # High surrogate: decode together with its \uXXXX low half
+            if i + 12 > end:
+                break
+            if text[i + 6:i + 8] != "\\u":
+                break
+            try:
+                low = int(text[i + 8:i + 12], 16)
+            except ValueError:
+                break
+            if not 0xDC00 <= low <= 0xDFFF:
+                break
+            chars.append(chr(0x10000 + ((code_point - 0xD800) << 10) + (low - 0xDC00)))
+            i += 12
+            continue
+        chars.append(chr(code_point))
+        i += 6
+
+    return "".join(chars)
+
+
 class AgentResponse:
     """Structured agent response"""
-    
+
+    # Fixed attribute set; no per-instance __dict__
+    __slots__ = ("raw", "parsed", "error")
+
     def __init__(self, raw_response: str):
         self.raw = raw_response
         self.parsed: Optional[Dict] = None
@@ -35,27 +181,28 @@ class AgentResponse:
         try:
             # Extract JSON from response (might be wrapped in markdown)
             json_str = self._extract_json(raw_response)
-            self.parsed = json.loads(json_str)
+            self.parsed = orjson.loads(json_str)
         except Exception as e:
             self.error = f"Failed to parse agent response: {str(e)}"
     
     def _extract_json(self, text: str) -> str:
         """Extract JSON from potentially markdown-wrapped text"""
-        # Remove markdown code blocks if present
-        if "```json" in text:
-            start = text.find("```json") + 7
-            end = text.find("```", start)
-            return text[start:end].strip()
-        elif "```" in text:
-            start = text.find("```") + 3
-            end = text.find("```", start)
-            return text[start:end].strip()
-        else:
-            # Try to find JSON object
-            start = text.find("{")
-            end = text.rfind("}") + 1
-            if start != -1 and end > start:
+        # Markdown code fence takes priority
+        match = _FENCE_RE.search(text)
+        if match:
+            return match.group(1)
+
+        # Otherwise decode the first complete JSON object in the text;
+        # raw_decode stops at its closing brace, so trailing prose
+        # (or stray braces in it) can't corrupt the extraction
+        start = text.find("{")
+        if start != -1:
+            try:
+                _, end = _JSON_DECODER.raw_decode(text, start)
                 return text[start:end]
+            except ValueError:
+                pass
+
         return text
     
     def is_valid(self) -> bool:
@@ -84,7 +231,12 @@ class AgentResponse:
 
 class TikTokAdsAgent:
     """AI Agent for TikTok Ad campaign creation"""
-    
+
+    # The only keys the LLM may write into campaign_data
+    _CAMPAIGN_FIELDS = frozenset({
+        "campaign_name", "objective", "ad_text", "cta", "music_id", "music_status"
+    })
+
     def __init__(
         self,
         oauth_manager: TikTokOAuthManager,
@@ -96,11 +248,13 @@ class TikTokAdsAgent:
         self.use_mock = use_mock
         
         # LLM client
-        self.llm_provider = Config.get_llm_provider()
+        if CONFIG.llm_provider is None:
+            raise ValueError("No LLM API key configured")
+        self.llm_provider = CONFIG.llm_provider
         self._init_llm_client()
         
-        # Conversation state
-        self.conversation_history: List[Dict] = []
+        # Conversation state (bounded: only the turns we'd send to the LLM)
+        self.conversation_history: Deque[Dict] = deque(maxlen=20)
         self.campaign_data: Dict = {
             "campaign_name": None,
             "objective": None,
@@ -109,61 +263,95 @@ class TikTokAdsAgent:
             "music_id": None,
             "music_status": "not_requested"
         }
-        
-        # System prompt
+
+        # Last completed turn, used to short-circuit exact repeats
+        self._last_user_input: Optional[str] = None
+        self._last_response: Optional[str] = None
+
+        # System prompt, plus the constant message object sent on every call.
+        # Reusing the identical prefix keeps provider-side prompt caches warm;
+        # never mutate _system_msg. OpenAI caches automatically on the
+        # byte-identical prefix; Anthropic needs the explicit cache_control
+        # block. Cache hits show up in usage.prompt_tokens_details.cached_tokens
+        # (OpenAI) / usage.cache_read_input_tokens (Anthropic).
         self.system_prompt = get_system_prompt()
+        self._system_msg = {"role": "system", "content": self.system_prompt}
+        self._anthropic_system = get_system_prompt("anthropic")
+
+        # Response cache for deterministic (temperature 0) calls
+        self.llm_cache = LLMCache()
+
+        # Interpreted API errors, keyed on the error identity: the same
+        # failure tends to repeat many times in a session, and a repeat
+        # should not cost another LLM round-trip
+        self._error_interp_cache: Dict[tuple, str] = {}
     
     def _init_llm_client(self):
         """Initialize LLM client based on provider"""
         if self.llm_provider == "openai":
-            from openai import OpenAI
-            self.llm_client = OpenAI(api_key=Config.OPENAI_API_KEY)
-            self.model = Config.OPENAI_MODEL
+            self.llm_client = AsyncOpenAI(api_key=CONFIG.openai_api_key)
+            self.model = CONFIG.openai_model
+            self._rate_limit_errors = (OpenAIRateLimitError,)
         elif self.llm_provider == "anthropic":
-            from anthropic import Anthropic
-            self.llm_client = Anthropic(api_key=Config.ANTHROPIC_API_KEY)
-            self.model = Config.ANTHROPIC_MODEL
-    
-    def start_conversation(self) -> str:
+            self.llm_client = AsyncAnthropic(api_key=CONFIG.anthropic_api_key)
+            self.model = CONFIG.anthropic_model
+            self._rate_limit_errors = (AnthropicRateLimitError,)
+
+    async def start_conversation(self) -> str:
         """Start the ad creation conversation"""
         initial_message = "I want to create a TikTok ad campaign"
-        return self.process_user_input(initial_message)
-    
-    def process_user_input(self, user_input: str) -> str:
+        return await self.process_user_input(initial_message)
+
+    def start_conversation_sync(self) -> str:
+        """Synchronous wrapper around start_conversation for CLI callers"""
+        return asyncio.run(self.start_conversation())
+
+    async def process_user_input(self, user_input: str) -> str:
         """
         Process user input and return agent response
-        
+
         This is the main conversation loop
         """
+        # Cheap pre-filter: trivially answerable turns never reach the LLM
+        shortcut = self._pretrial(user_input)
+        if shortcut is not None:
+            self.conversation_history.append({
+                "role": "user",
+                "content": user_input
+            })
+            self.conversation_history.append({
+                "role": "assistant",
+                "content": shortcut
+            })
+            return shortcut
+
         # Add user message to history
         self.conversation_history.append({
             "role": "user",
             "content": user_input
         })
-        
+
         # Get LLM response
-        llm_response = self._call_llm(user_input)
-        
+        llm_response = await self._call_llm(user_input)
+
         # Parse structured response
         agent_response = AgentResponse(llm_response)
-        
-        if Config.DEBUG:
+
+        if __debug__ and DEBUG:
             print(f"\n[DEBUG] Agent response: {agent_response.parsed}\n")
-        
+
         # Update campaign data
-        collected = agent_response.get_collected_data()
-        if collected:
-            self.campaign_data.update(collected)
-        
+        self._merge_collected(agent_response.get_collected_data())
+
         # Handle next action
         next_action = agent_response.get_next_action()
-        
+
         if next_action == "validate_music":
-            return self._handle_music_validation(agent_response)
+            response_text = await self._handle_music_validation(agent_response)
         elif next_action == "submit":
-            return self._handle_submission(agent_response)
+            response_text = await self._handle_submission(agent_response)
         elif next_action == "enforce_rule":
-            return self._handle_rule_enforcement(agent_response)
+            response_text = await self._handle_rule_enforcement(agent_response)
         else:
             # Continue conversation
             response_text = agent_response.get_conversation_response()
@@ -171,48 +359,276 @@ class TikTokAdsAgent:
                 "role": "assistant",
                 "content": response_text
             })
-            return response_text
-    
-    def _call_llm(self, user_message: str, additional_context: str = "") -> str:
-        """Call LLM with conversation history"""
-        messages = [
-            {"role": "system", "content": self.system_prompt}
-        ]
-        
-        # Add conversation history (keep last 10 turns)
-        messages.extend(self.conversation_history[-10:])
-        
-        # Add additional context if provided
+
+        # Remember the turn so an exact repeat can replay the answer.
+        # Only plain conversation turns are memoized: validate/submit/
+        # enforce turns have side effects (API calls, state changes), and
+        # a repeat must re-run them - e.g. retyping the same phrase after
+        # a transient submission failure should retry create_ad, not
+        # replay the stale failure text. An action turn also drops any
+        # earlier memo, so pre-action answers can't replay across it.
+        if next_action in ("validate_music", "submit", "enforce_rule"):
+            self._last_user_input = None
+            self._last_response = None
+        else:
+            self._last_user_input = user_input.strip()
+            self._last_response = response_text
+
+        return response_text
+
+    def _merge_collected(self, collected: Dict):
+        """
+        Merge LLM-collected fields into campaign_data
+
+        Only known fields are written, and None never overwrites a
+        collected value - so a validated music_id (and its
+        music_status) survives turns where the LLM re-emits nulls.
+        """
+        campaign_data = self.campaign_data
+        for key, value in collected.items():
+            if (
+                key in self._CAMPAIGN_FIELDS
+                and value is not None
+                and value != campaign_data[key]
+            ):
+                campaign_data[key] = value
+
+    def _pretrial(self, user_input: str) -> Optional[str]:
+        """
+        Return a static response for turns that don't need the LLM
+        (empty input, bare greetings, slash commands, exact repeats),
+        or None to continue with the normal LLM path
+        """
+        stripped = user_input.strip()
+
+        if not stripped:
+            return (
+                "I didn't catch that - could you tell me more about "
+                "the ad campaign you'd like to create?"
+            )
+
+        if stripped.startswith("/"):
+            command = stripped.lower()
+            if command == "/reset":
+                self.reset()
+                return "Campaign data reset. Let's start fresh - what would you like to advertise?"
+            elif command == "/summary":
+                return self.get_campaign_summary()
+            return f"Unknown command: {stripped}. Available commands: /reset, /summary"
+
+        if _GREETING_RE.match(stripped):
+            return (
+                "Hi! I can help you create a TikTok ad campaign. "
+                "What product or service would you like to advertise?"
+            )
+
+        # Exact repeat of the previous turn: replay the previous answer
+        if stripped == self._last_user_input and self._last_response is not None:
+            return self._last_response
+
+        return None
+
+    def process_user_input_sync(self, user_input: str) -> str:
+        """Synchronous wrapper around process_user_input for CLI callers"""
+        return asyncio.run(self.process_user_input(user_input))
+
+    async def process_user_input_stream(self, user_input: str) -> AsyncIterator[str]:
+        """
+        Process user input, yielding the conversation_response incrementally
+
+        The user-visible text appears early in the structured reply, so
+        streaming it cuts perceived latency to time-to-first-token instead
+        of full completion time. Action handling (music validation,
+        submission) runs after the stream completes; any handler response
+        is yielded as a final chunk.
+        """
+        self.conversation_history.append({
+            "role": "user",
+            "content": user_input
+        })
+
+        chunks: List[str] = []
+        emitted = 0
+
+        async for chunk in self._call_llm_stream(user_input):
+            chunks.append(chunk)
+            partial = _extract_partial_response("".join(chunks))
+            if len(partial) > emitted:
+                yield partial[emitted:]
+                emitted = len(partial)
+
+        agent_response = AgentResponse("".join(chunks))
+
+        if __debug__ and DEBUG:
+            print(f"\n[DEBUG] Agent response: {agent_response.parsed}\n")
+
+        self._merge_collected(agent_response.get_collected_data())
+
+        next_action = agent_response.get_next_action()
+
+        if next_action == "validate_music":
+            yield "\n" + await self._handle_music_validation(agent_response)
+        elif next_action == "submit":
+            yield "\n" + await self._handle_submission(agent_response)
+        elif next_action == "enforce_rule":
+            yield "\n" + await self._handle_rule_enforcement(agent_response)
+        else:
+            response_text = agent_response.get_conversation_response()
+            self.conversation_history.append({
+                "role": "assistant",
+                "content": response_text
+            })
+            # Emit anything the incremental extraction missed
+            if len(response_text) > emitted:
+                yield response_text[emitted:]
+
+    async def _call_llm_stream(
+        self,
+        user_message: str,
+        additional_context: str = ""
+    ) -> AsyncIterator[str]:
+        """
+        Stream the raw LLM completion chunk by chunk
+
+        Stops as soon as the top-level JSON object closes, so trailing
+        prose never delays completion.
+        """
+        messages = [self._system_msg, *self.conversation_history]
+
         if additional_context:
             messages.append({
                 "role": "user",
                 "content": additional_context
             })
-        
-        # Call appropriate LLM
-        if self.llm_provider == "openai":
-            response = self.llm_client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=0.7,
-                max_tokens=1000
-            )
-            return response.choices[0].message.content
-        
-        elif self.llm_provider == "anthropic":
-            # Extract system prompt
-            system = messages[0]["content"]
-            conversation = messages[1:]
-            
-            response = self.llm_client.messages.create(
-                model=self.model,
-                max_tokens=1000,
-                system=system,
-                messages=conversation
-            )
-            return response.content[0].text
-    
-    def _handle_music_validation(self, agent_response: AgentResponse) -> str:
+
+        tracker = _TopLevelJsonTracker()
+
+        # Hold the semaphore for the whole stream: an in-flight stream
+        # consumes provider rate-limit budget until it finishes
+        async with _LLM_SEM:
+            if self.llm_provider == "openai":
+                stream = await self.llm_client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    temperature=0.7,
+                    max_tokens=1000,
+                    stream=True
+                )
+                async for chunk in stream:
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        yield delta
+                        if tracker.feed(delta):
+                            break
+
+            elif self.llm_provider == "anthropic":
+                conversation = messages[1:]
+
+                async with self.llm_client.messages.stream(
+                    model=self.model,
+                    max_tokens=1000,
+                    system=self._anthropic_system,
+                    messages=conversation
+                ) as stream:
+                    async for delta in stream.text_stream:
+                        yield delta
+                        if tracker.feed(delta):
+                            break
+
+    async def _call_llm(
+        self,
+        user_message: str,
+        additional_context: str = "",
+        deterministic: bool = False
+    ) -> str:
+        """
+        Call LLM with conversation history
+
+        Deterministic calls run at temperature 0 and are served from the
+        response cache when the exact same payload was seen before.
+        """
+        if deterministic:
+            # History-free payload: deterministic callers pass a
+            # self-contained context (error interpretation), and leaving
+            # out the ever-growing conversation history is what makes the
+            # payload a pure function of that context - and the cache hit
+            messages = [self._system_msg, {
+                "role": "user",
+                "content": additional_context
+            }]
+        else:
+            # Constant system prefix + bounded history
+            messages = [self._system_msg, *self.conversation_history]
+
+            # Add additional context if provided
+            if additional_context:
+                messages.append({
+                    "role": "user",
+                    "content": additional_context
+                })
+
+        temperature = 0.0 if deterministic else 0.7
+
+        # Deterministic payloads are pure functions of their input - cache them
+        cache_key = None
+        if deterministic:
+            cache_key = LLMCache.make_key({
+                "model": self.model,
+                "messages": messages,
+                "temperature": temperature
+            })
+            cached = self.llm_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        text = await self._call_provider(messages, temperature)
+
+        if cache_key is not None:
+            self.llm_cache.set(cache_key, text)
+
+        return text
+
+    # Retry schedule for rate-limited calls: random exponential backoff
+    MAX_LLM_ATTEMPTS = 6
+    MAX_BACKOFF_SECONDS = 20.0
+
+    async def _call_provider(self, messages: List[Dict], temperature: float) -> str:
+        """
+        Single provider round-trip, bounded by the process-wide semaphore
+        and retried with random exponential backoff on rate limits
+        """
+        backoff = 1.0
+        provider = self.llm_provider
+
+        for attempt in range(self.MAX_LLM_ATTEMPTS):
+            try:
+                async with _LLM_SEM:
+                    if provider == "openai":
+                        response = await self.llm_client.chat.completions.create(
+                            model=self.model,
+                            messages=messages,
+                            temperature=temperature,
+                            max_tokens=1000
+                        )
+                        return response.choices[0].message.content
+
+                    elif provider == "anthropic":
+                        # Cacheable system block, conversation as messages
+                        response = await self.llm_client.messages.create(
+                            model=self.model,
+                            max_tokens=1000,
+                            system=self._anthropic_system,
+                            messages=messages[1:]
+                        )
+                        return response.content[0].text
+
+            except self._rate_limit_errors:
+                if attempt == self.MAX_LLM_ATTEMPTS - 1:
+                    raise
+                await asyncio.sleep(random.uniform(1.0, backoff))
+                backoff = min(backoff * 2, self.MAX_BACKOFF_SECONDS)
+
+    async def _handle_music_validation(self, agent_response: AgentResponse) -> str:
         """Handle music validation request"""
         music_id = self.campaign_data.get("music_id")
         
@@ -220,7 +636,7 @@ class TikTokAdsAgent:
             return "Please provide a Music ID to validate."
         
         # Call API to validate
-        result = self.api_client.validate_music(music_id)
+        result = await self.api_client.validate_music(music_id)
         
         # Update music status
         if result["valid"]:
@@ -235,11 +651,15 @@ class TikTokAdsAgent:
             self.campaign_data["music_status"] = "error"
             self.campaign_data["music_id"] = None
             
-            # Get LLM to interpret error
+            # Get LLM to interpret error (pure function of the error -> cacheable).
+            # Scheduled as a task so it starts immediately and can overlap with
+            # other work on the event loop (concurrent sessions, API calls).
             error_context = get_music_validation_prompt(result)
-            interpretation = self._call_llm("", error_context)
-            
-            parsed = AgentResponse(interpretation)
+            interp_task = asyncio.create_task(
+                self._call_llm("", error_context, deterministic=True)
+            )
+
+            parsed = AgentResponse(await interp_task)
             response = parsed.get_conversation_response()
         
         self.conversation_history.append({
@@ -249,7 +669,7 @@ class TikTokAdsAgent:
         
         return response
     
-    def _handle_submission(self, agent_response: AgentResponse) -> str:
+    async def _handle_submission(self, agent_response: AgentResponse) -> str:
         """Handle ad submission"""
         # Final validation
         errors = CampaignValidator.validate_all(self.campaign_data)
@@ -265,7 +685,7 @@ class TikTokAdsAgent:
             return error_msg
         
         # Submit to API
-        result = self.api_client.create_ad(self.campaign_data)
+        result = await self.api_client.create_ad(self.campaign_data)
         
         if result["success"]:
             response = (
@@ -277,17 +697,13 @@ class TikTokAdsAgent:
                 f"Your ad will be reviewed by TikTok and should go live within 24 hours."
             )
         else:
-            # Interpret error
-            error_prompt = get_error_interpretation_prompt(
+            # Interpret error (cached: repeat failures skip the LLM)
+            response = await self._interpret_error_cached(
                 error_type="SUBMISSION_ERROR",
                 status_code=result.get("error_details", {}).get("code", 500),
                 error_message=result["error"],
                 context="Ad submission failed"
             )
-            
-            interpretation = self._call_llm("", error_prompt)
-            parsed = AgentResponse(interpretation)
-            response = parsed.get_conversation_response()
         
         self.conversation_history.append({
             "role": "assistant",
@@ -296,7 +712,44 @@ class TikTokAdsAgent:
         
         return response
     
-    def _handle_rule_enforcement(self, agent_response: AgentResponse) -> str:
+    # Bound on distinct cached error interpretations per session
+    ERROR_INTERP_CACHE_MAX = 256
+
+    async def _interpret_error_cached(
+        self,
+        error_type: str,
+        status_code: int,
+        error_message: str,
+        context: str
+    ) -> str:
+        """
+        Interpret an API error via the LLM, reusing prior interpretations
+
+        Keyed on (error_type, status_code, error_message) only — context
+        is dynamic and would make every lookup miss. The interpretation
+        is a pure function of the error, so a cached answer stays valid
+        for the whole session.
+        """
+        key = (error_type, status_code, error_message)
+        cached = self._error_interp_cache.get(key)
+        if cached is not None:
+            return cached
+
+        error_prompt = get_error_interpretation_prompt(
+            error_type=error_type,
+            status_code=status_code,
+            error_message=error_message,
+            context=context
+        )
+        interpretation = await self._call_llm("", error_prompt, deterministic=True)
+        response = AgentResponse(interpretation).get_conversation_response()
+
+        if len(self._error_interp_cache) >= self.ERROR_INTERP_CACHE_MAX:
+            self._error_interp_cache.clear()
+        self._error_interp_cache[key] = response
+        return response
+
+    async def _handle_rule_enforcement(self, agent_response: AgentResponse) -> str:
         """Handle business rule enforcement"""
         # This is triggered when LLM detects a rule violation
         response = agent_response.get_conversation_response()
@@ -326,7 +779,9 @@ class TikTokAdsAgent:
     
     def reset(self):
         """Reset agent state for new campaign"""
-        self.conversation_history = []
+        self.conversation_history = deque(maxlen=20)
+        self._last_user_input = None
+        self._last_response = None
         self.campaign_data = {
             "campaign_name": None,
             "objective": None,
@@ -8,17 +8,71 @@ Handles all API interactions:
 - Error handling and interpretation
 """
 
-from typing import Dict, Optional
-import requests
+import asyncio
+import re
+import time
+from typing import Callable, Dict, Optional
 
-from config import Config
+import httpx
+import orjson
+
+from config import CONFIG
 from oauth_manager import TikTokOAuthManager
 from mock_api import get_mock_api
 
 
+# Music validation error codes -> user-facing explanations
+_MUSIC_INTERPRETATIONS: Dict[str, str] = {
+    "40300": "This Music ID doesn't exist in TikTok's music library.",
+    "40301": "This music is not available in your target region due to licensing restrictions.",
+    "40302": "This music has copyright restrictions and cannot be used.",
+    "40303": "This music has been removed or is no longer available.",
+    "MUSIC_NOT_FOUND": "This Music ID doesn't exist in TikTok's music library.",
+    "MUSIC_GEO_RESTRICTED": "This music is not available in your region.",
+    "MUSIC_COPYRIGHT": "This music has copyright restrictions."
+}
+
+_MUSIC_ERROR_SUGGESTION = (
+    "\n\nWhat would you like to do?\n"
+    "1. Try a different Music ID\n"
+    "2. Upload your own custom music\n"
+    "3. Continue without music (only for Traffic campaigns)"
+)
+
+_PERMISSION_RE = re.compile(r"permission", re.IGNORECASE)
+_REGION_RE = re.compile(r"region|geo", re.IGNORECASE)
+
+
+def _interpret_permission_error(message: str) -> Optional[str]:
+    if _PERMISSION_RE.search(message):
+        return (
+            "Your app doesn't have permission for ad creation. "
+            "Please add required scopes in TikTok Developer dashboard."
+        )
+    if _REGION_RE.search(message):
+        return (
+            "Ad creation is not available in your region. "
+            "You may need to use a VPN or regional account."
+        )
+    return None
+
+
+# Submission error codes -> message handlers (None result falls through
+# to the generic "Submission failed" text)
+_SUBMISSION_HANDLERS: Dict[int, Callable[[str], Optional[str]]] = {
+    40100: lambda m: "Your access token is invalid or expired. Let me help you re-authenticate.",
+    40104: _interpret_permission_error,
+    40300: lambda m: f"Invalid music: {m}",
+    429: lambda m: "TikTok is rate limiting requests. Let's wait a moment and try again.",
+}
+
+
 class APIError(Exception):
     """Custom exception for API errors"""
-    
+
+    # Fixed attribute set; no per-instance __dict__
+    __slots__ = ("status_code", "error_code", "message", "context")
+
     def __init__(
         self,
         status_code: int,
@@ -42,25 +96,59 @@ class APIError(Exception):
 
 
 class TikTokAPIClient:
-    """Client for TikTok Ads API"""
-    
+    """Async client for TikTok Ads API"""
+
     def __init__(self, oauth_manager: TikTokOAuthManager, use_mock: bool = False):
         self.oauth_manager = oauth_manager
         self.use_mock = use_mock
-        self.base_url = Config.TIKTOK_API_BASE_URL
-    
+        self.base_url = CONFIG.tiktok_api_base_url
+
+        # Pooled async client: keep-alive connections shared across calls,
+        # with connect-level retries on transient network errors
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=30,
+            limits=httpx.Limits(max_connections=50),
+            transport=httpx.AsyncHTTPTransport(retries=3)
+        )
+
+        # Bound in-flight requests to respect TikTok's rate limits
+        self._semaphore = asyncio.Semaphore(CONFIG.max_concurrent_requests)
+
+        # Short-lived header cache so every call doesn't re-run token
+        # validation/refresh in the OAuth manager
+        self._headers: Optional[Dict[str, str]] = None
+        self._headers_expire_at: float = 0.0
+
+    async def aclose(self):
+        """Close the underlying connection pool"""
+        await self.client.aclose()
+
+    # How long cached headers stay valid before re-consulting the OAuth manager
+    HEADER_CACHE_TTL = 300
+
     def _get_headers(self) -> Dict[str, str]:
-        """Get request headers with access token"""
+        """Get request headers with access token (cached for a short window)"""
+        if self._headers is not None and time.monotonic() < self._headers_expire_at:
+            return self._headers
+
         access_token = self.oauth_manager.get_access_token()
-        return {
+        self._headers = {
             "Access-Token": access_token,
             "Content-Type": "application/json"
         }
+        # Clamp the cache window to the token's own validity so a header
+        # built shortly before expiry never outlives its token
+        self._headers_expire_at = min(
+            time.monotonic() + self.HEADER_CACHE_TTL,
+            self.oauth_manager.token_valid_until()
+        )
+        return self._headers
     
-    def validate_music(self, music_id: str) -> Dict:
+    async def validate_music(self, music_id: str) -> Dict:
         """
         Validate a music ID
-        
+
         Returns:
             {
                 "valid": bool,
@@ -70,14 +158,14 @@ class TikTokAPIClient:
         """
         if self.use_mock:
             return self._mock_validate_music(music_id)
-        
+
         try:
-            url = f"{self.base_url}/music/info/"
             params = {"music_id": music_id}
             headers = self._get_headers()
-            
-            response = requests.get(url, params=params, headers=headers)
-            data = response.json()
+
+            async with self._semaphore:
+                response = await self.client.get("/music/info/", params=params, headers=headers)
+            data = orjson.loads(response.content)
             
             if data.get("code") == 0:
                 return {
@@ -92,7 +180,7 @@ class TikTokAPIClient:
                     "data": None
                 }
         
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             return {
                 "valid": False,
                 "error": f"Network error: {str(e)}",
@@ -119,10 +207,10 @@ class TikTokAPIClient:
                 "data": None
             }
     
-    def upload_music(self, file_path: str) -> Dict:
+    async def upload_music(self, file_path: str) -> Dict:
         """
         Upload custom music file
-        
+
         Returns:
             {
                 "success": bool,
@@ -132,17 +220,24 @@ class TikTokAPIClient:
         """
         if self.use_mock:
             return self._mock_upload_music(file_path)
-        
+
         try:
-            url = f"{self.base_url}/file/music/upload/"
-            headers = self._get_headers()
-            
-            # In production, this would upload the actual file
-            # For now, simulate with file metadata
-            files = {"music_file": ("music.mp3", open(file_path, "rb"), "audio/mpeg")}
-            
-            response = requests.post(url, headers=headers, files=files)
-            data = response.json()
+            # Multipart needs its own boundary Content-Type, and httpx
+            # streams the body chunk-by-chunk from the open file handle,
+            # so memory stays O(chunk) instead of O(filesize)
+            headers = {"Access-Token": self._get_headers()["Access-Token"]}
+
+            with open(file_path, "rb") as music_file:
+                files = {"music_file": ("music.mp3", music_file, "audio/mpeg")}
+
+                async with self._semaphore:
+                    response = await self.client.post(
+                        "/file/music/upload/",
+                        headers=headers,
+                        files=files,
+                        timeout=httpx.Timeout(600, connect=3.05)
+                    )
+            data = orjson.loads(response.content)
             
             if data.get("code") == 0:
                 return {
@@ -184,7 +279,7 @@ class TikTokAPIClient:
                 "error": response.get("message", "Upload failed")
             }
     
-    def create_ad(self, campaign_data: Dict) -> Dict:
+    async def create_ad(self, campaign_data: Dict) -> Dict:
         """
         Submit ad campaign
         
@@ -203,14 +298,14 @@ class TikTokAPIClient:
             return self._mock_create_ad(campaign_data)
         
         try:
-            url = f"{self.base_url}/ad/create/"
             headers = self._get_headers()
-            
+
             # Build TikTok API payload
             payload = self._build_ad_payload(campaign_data)
-            
-            response = requests.post(url, json=payload, headers=headers)
-            data = response.json()
+
+            async with self._semaphore:
+                response = await self.client.post("/ad/create/", content=orjson.dumps(payload), headers=headers)
+            data = orjson.loads(response.content)
             
             if data.get("code") == 0:
                 return {
@@ -227,7 +322,7 @@ class TikTokAPIClient:
                     "error_details": data
                 }
         
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             return {
                 "success": False,
                 "ad_id": None,
@@ -281,55 +376,29 @@ class TikTokAPIClient:
         """Interpret music validation error"""
         code = error_response.get("code", "")
         message = error_response.get("message", "")
-        
-        interpretations = {
-            "40300": "This Music ID doesn't exist in TikTok's music library.",
-            "40301": "This music is not available in your target region due to licensing restrictions.",
-            "40302": "This music has copyright restrictions and cannot be used.",
-            "40303": "This music has been removed or is no longer available.",
-            "MUSIC_NOT_FOUND": "This Music ID doesn't exist in TikTok's music library.",
-            "MUSIC_GEO_RESTRICTED": "This music is not available in your region.",
-            "MUSIC_COPYRIGHT": "This music has copyright restrictions."
-        }
-        
-        base_error = interpretations.get(str(code), message or "Unknown music validation error")
-        
-        suggestion = (
-            "\n\nWhat would you like to do?\n"
-            "1. Try a different Music ID\n"
-            "2. Upload your own custom music\n"
-            "3. Continue without music (only for Traffic campaigns)"
-        )
-        
-        return base_error + suggestion
-    
+
+        base_error = _MUSIC_INTERPRETATIONS.get(str(code), message or "Unknown music validation error")
+
+        return base_error + _MUSIC_ERROR_SUGGESTION
+
     def _interpret_submission_error(self, error_response: Dict) -> str:
         """Interpret ad submission error"""
         code = error_response.get("code", "")
         message = error_response.get("message", "")
-        
-        # Token errors
-        if code == 40100:
-            return "Your access token is invalid or expired. Let me help you re-authenticate."
-        
-        # Permission errors
-        elif code == 40104:
-            if "permission" in message.lower():
-                return "Your app doesn't have permission for ad creation. Please add required scopes in TikTok Developer dashboard."
-            elif "region" in message.lower() or "geo" in message.lower():
-                return "Ad creation is not available in your region. You may need to use a VPN or regional account."
-        
-        # Music errors
-        elif code == 40300:
-            return f"Invalid music: {message}"
-        
-        # Rate limiting
-        elif code == 429:
-            return "TikTok is rate limiting requests. Let's wait a moment and try again."
-        
+
+        try:
+            code = int(code)
+        except (TypeError, ValueError):
+            return f"Submission failed: {message}"
+
+        handler = _SUBMISSION_HANDLERS.get(code)
+        if handler:
+            interpreted = handler(message)
+            if interpreted:
+                return interpreted
+
         # Server errors
-        elif int(code) >= 500:
+        if code >= 500:
             return "TikTok's API is experiencing issues. Would you like to retry or save as draft?"
-        
-        else:
-            return f"Submission failed: {message}"
\ No newline at end of file
+
+        return f"Submission failed: {message}"
\ No newline at end of file
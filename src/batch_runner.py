@@ -0,0 +1,133 @@
+"""
+Batch processing via OpenAI's Batch API
+
+For offline workloads where latency doesn't matter (bulk drafting from a
+CSV, regression-testing prompts, reprocessing conversation logs), the
+Batch API trades a completion window of up to 24h for a ~50% cost
+discount versus per-call chat completions.
+
+Enabled with USE_BATCH_API=true; results flow through the same
+AgentResponse parse path as interactive completions.
+"""
+
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from config import CONFIG
+from prompts import get_system_prompt
+
+
+class BatchError(Exception):
+    """Raised when a batch fails or times out"""
+
+
+class BatchProcessor:
+    """Submits prompt batches to OpenAI's Batch API and collects results"""
+
+    COMPLETIONS_URL = "/v1/chat/completions"
+
+    # Polling schedule: exponential backoff capped at 60s
+    INITIAL_POLL_INTERVAL = 5.0
+    MAX_POLL_INTERVAL = 60.0
+
+    def __init__(self, model: Optional[str] = None):
+        if not CONFIG.use_batch_api:
+            raise BatchError(
+                "Batch processing is disabled - set USE_BATCH_API=true in .env"
+            )
+        from openai import OpenAI
+        self.client = OpenAI(api_key=CONFIG.openai_api_key)
+        self.model = model or CONFIG.openai_model
+        self.system_prompt = get_system_prompt()
+
+    def batch_process(
+        self,
+        requests: List[str],
+        max_wait_seconds: float = 86400
+    ) -> List[str]:
+        """
+        Run a list of user prompts through the Batch API
+
+        Returns completions in the same order as the input prompts.
+        Raises BatchError if the batch fails or the wait times out.
+        """
+        batch_file = self._write_batch_file(requests)
+
+        try:
+            with batch_file.open("rb") as f:
+                uploaded = self.client.files.create(
+                    file=f,
+                    purpose="batch"
+                )
+            batch = self.client.batches.create(
+                input_file_id=uploaded.id,
+                endpoint=self.COMPLETIONS_URL,
+                completion_window="24h"
+            )
+        finally:
+            batch_file.unlink(missing_ok=True)
+
+        batch = self._wait_for_completion(batch.id, max_wait_seconds)
+        return self._collect_results(batch, len(requests))
+
+    def _write_batch_file(self, requests: List[str]) -> Path:
+        """Serialize prompts to the JSONL format the Batch API expects"""
+        lines = []
+        for i, user_input in enumerate(requests):
+            lines.append(json.dumps({
+                "custom_id": str(i),
+                "method": "POST",
+                "url": self.COMPLETIONS_URL,
+                "body": {
+                    "model": self.model,
+                    "messages": [
+                        {"role": "system", "content": self.system_prompt},
+                        {"role": "user", "content": user_input}
+                    ],
+                    "temperature": 0.7,
+                    "max_tokens": 1000
+                }
+            }))
+
+        with tempfile.NamedTemporaryFile(
+            mode="w", suffix=".jsonl", delete=False
+        ) as f:
+            f.write("\n".join(lines))
+            return Path(f.name)
+
+    def _wait_for_completion(self, batch_id: str, max_wait_seconds: float):
+        """Poll the batch with exponential backoff until it finishes"""
+        interval = self.INITIAL_POLL_INTERVAL
+        deadline = time.monotonic() + max_wait_seconds
+
+        while time.monotonic() < deadline:
+            batch = self.client.batches.retrieve(batch_id)
+
+            if batch.status == "completed":
+                return batch
+            if batch.status in ("failed", "expired", "cancelled"):
+                raise BatchError(f"Batch {batch_id} ended with status: {batch.status}")
+
+            time.sleep(interval)
+            interval = min(interval * 2, self.MAX_POLL_INTERVAL)
+
+        raise BatchError(f"Batch {batch_id} did not complete within {max_wait_seconds}s")
+
+    def _collect_results(self, batch, expected: int) -> List[str]:
+        """Download batch output and order completions by custom_id"""
+        content = self.client.files.content(batch.output_file_id)
+
+        results: dict[int, str] = {}
+        for line in content.text.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            body = record.get("response", {}).get("body", {})
+            choices = body.get("choices", [])
+            if choices:
+                results[int(record["custom_id"])] = choices[0]["message"]["content"]
+
+        return [results.get(i, "") for i in range(expected)]
@@ -3,6 +3,8 @@ Configuration management for TikTok Ads AI Agent
 """
 
 import os
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from dotenv import load_dotenv
 from typing import Optional
@@ -10,79 +12,130 @@ from typing import Optional
 # Load environment variables
 load_dotenv()
 
+
+# No slots=True: it would require Python 3.10 (the docs promise 3.9+),
+# and with a single CONFIG instance the per-instance savings are nil
+@dataclass(frozen=True)
 class Config:
-    """Application configuration"""
-    
+    """Application configuration, parsed from the environment exactly once"""
+
     # LLM Configuration
-    OPENAI_API_KEY: Optional[str] = os.getenv("OPENAI_API_KEY")
-    OPENAI_MODEL: str = os.getenv("OPENAI_MODEL", "gpt-4-turbo-preview")
-    
-    ANTHROPIC_API_KEY: Optional[str] = os.getenv("ANTHROPIC_API_KEY")
-    ANTHROPIC_MODEL: str = os.getenv("ANTHROPIC_MODEL", "claude-3-5-sonnet-20241022")
-    
+    openai_api_key: Optional[str]
+    openai_model: str
+    anthropic_api_key: Optional[str]
+    anthropic_model: str
+
+    # Derived at load time (None when no LLM key is configured)
+    llm_provider: Optional[str]
+
     # TikTok OAuth Configuration
-    TIKTOK_APP_ID: Optional[str] = os.getenv("TIKTOK_APP_ID")
-    TIKTOK_APP_SECRET: Optional[str] = os.getenv("TIKTOK_APP_SECRET")
-    TIKTOK_REDIRECT_URI: str = os.getenv("TIKTOK_REDIRECT_URI", "http://localhost:8080/callback")
-    
+    tiktok_app_id: Optional[str]
+    tiktok_app_secret: Optional[str]
+    tiktok_redirect_uri: str
+
     # API Configuration
-    TIKTOK_API_BASE_URL: str = os.getenv(
-        "TIKTOK_API_BASE_URL", 
-        "https://business-api.tiktok.com/open_api/v1.3"
-    )
-    
+    tiktok_api_base_url: str
+
+    # Maximum in-flight TikTok API requests (rate-limit guard)
+    max_concurrent_requests: int
+
+    # Maximum in-flight LLM calls across all sessions (rate-limit guard)
+    llm_max_concurrent: int
+
     # Mode Configuration
-    USE_MOCK_API: bool = os.getenv("USE_MOCK_API", "false").lower() == "true"
-    DEBUG: bool = os.getenv("DEBUG", "false").lower() == "true"
-    
+    use_mock_api: bool
+    use_batch_api: bool
+    debug: bool
+
     # OAuth Server Configuration
-    OAUTH_SERVER_HOST: str = os.getenv("OAUTH_SERVER_HOST", "localhost")
-    OAUTH_SERVER_PORT: int = int(os.getenv("OAUTH_SERVER_PORT", "8080"))
-    
+    oauth_server_host: str
+    oauth_server_port: int
+
     # Paths
-    BASE_DIR: Path = Path(__file__).parent.parent
-    CREDENTIALS_FILE: Path = BASE_DIR / "credentials.json"
-    
+    base_dir: Path
+    credentials_file: Path
+
     @classmethod
-    def validate(cls) -> list[str]:
-        """Validate configuration and return list of errors"""
+    def load(cls) -> "Config":
+        """Read the environment and build the immutable configuration"""
+        openai_api_key = os.getenv("OPENAI_API_KEY")
+        anthropic_api_key = os.getenv("ANTHROPIC_API_KEY")
+
+        if openai_api_key:
+            llm_provider = "openai"
+        elif anthropic_api_key:
+            llm_provider = "anthropic"
+        else:
+            llm_provider = None
+
+        base_dir = Path(__file__).parent.parent
+
+        return cls(
+            openai_api_key=openai_api_key,
+            openai_model=os.getenv("OPENAI_MODEL", "gpt-4-turbo-preview"),
+            anthropic_api_key=anthropic_api_key,
+            anthropic_model=os.getenv("ANTHROPIC_MODEL", "claude-3-5-sonnet-20241022"),
+            llm_provider=llm_provider,
+            tiktok_app_id=os.getenv("TIKTOK_APP_ID"),
+            tiktok_app_secret=os.getenv("TIKTOK_APP_SECRET"),
+            tiktok_redirect_uri=os.getenv("TIKTOK_REDIRECT_URI", "http://localhost:8080/callback"),
+            tiktok_api_base_url=os.getenv(
+                "TIKTOK_API_BASE_URL",
+                "https://business-api.tiktok.com/open_api/v1.3"
+            ),
+            max_concurrent_requests=int(os.getenv("MAX_CONCURRENT_REQUESTS", "10")),
+            llm_max_concurrent=int(os.getenv("LLM_MAX_CONCURRENT", "10")),
+            use_mock_api=os.getenv("USE_MOCK_API", "false").lower() == "true",
+            use_batch_api=os.getenv("USE_BATCH_API", "false").lower() == "true",
+            debug=os.getenv("DEBUG", "false").lower() == "true",
+            oauth_server_host=os.getenv("OAUTH_SERVER_HOST", "localhost"),
+            oauth_server_port=int(os.getenv("OAUTH_SERVER_PORT", "8080")),
+            base_dir=base_dir,
+            credentials_file=base_dir / "credentials.json",
+        )
+
+    @lru_cache(maxsize=1)
+    def validate(self) -> tuple[str, ...]:
+        """Validate configuration and return errors (memoized: the
+        configuration is immutable, so the result never changes)"""
         errors = []
-        
-        if not cls.USE_MOCK_API:
+
+        if not self.use_mock_api:
             # Validate TikTok credentials
-            if not cls.TIKTOK_APP_ID:
+            if not self.tiktok_app_id:
                 errors.append("TIKTOK_APP_ID not set in .env")
-            if not cls.TIKTOK_APP_SECRET:
+            if not self.tiktok_app_secret:
                 errors.append("TIKTOK_APP_SECRET not set in .env")
-        
+
         # Validate LLM configuration
-        if not cls.OPENAI_API_KEY and not cls.ANTHROPIC_API_KEY:
+        if self.llm_provider is None:
             errors.append("Either OPENAI_API_KEY or ANTHROPIC_API_KEY must be set")
-        
-        return errors
-    
-    @classmethod
-    def get_llm_provider(cls) -> str:
-        """Determine which LLM provider to use"""
-        if cls.OPENAI_API_KEY:
-            return "openai"
-        elif cls.ANTHROPIC_API_KEY:
-            return "anthropic"
-        else:
-            raise ValueError("No LLM API key configured")
-    
-    @classmethod
-    def print_config(cls):
+
+        return tuple(errors)
+
+    @lru_cache(maxsize=1)
+    def _config_summary(self) -> str:
+        """Format the configuration block (excluding secrets), once"""
+        model = self.openai_model if self.llm_provider == "openai" else self.anthropic_model
+        return (
+            "\n" + "="*60 + "\n"
+            "CONFIGURATION\n"
+            + "="*60 + "\n"
+            f"LLM Provider: {self.llm_provider or 'not configured'}\n"
+            f"Model: {model}\n"
+            f"Mock API Mode: {self.use_mock_api}\n"
+            f"Debug Mode: {self.debug}\n"
+            f"OAuth Server: {self.oauth_server_host}:{self.oauth_server_port}\n"
+            + "="*60 + "\n"
+        )
+
+    def print_config(self):
         """Print current configuration (excluding secrets)"""
-        print("\n" + "="*60)
-        print("CONFIGURATION")
-        print("="*60)
-        print(f"LLM Provider: {cls.get_llm_provider()}")
-        print(f"Model: {cls.OPENAI_MODEL if cls.get_llm_provider() == 'openai' else cls.ANTHROPIC_MODEL}")
-        print(f"Mock API Mode: {cls.USE_MOCK_API}")
-        print(f"Debug Mode: {cls.DEBUG}")
-        print(f"OAuth Server: {cls.OAUTH_SERVER_HOST}:{cls.OAUTH_SERVER_PORT}")
-        print("="*60 + "\n")
+        print(self._config_summary())
+
+
+# The single configuration instance used across the app
+CONFIG = Config.load()
 
 
 # Business Rules Configuration
@@ -95,13 +148,15 @@ class BusinessRules:
     # Ad text rules
     AD_TEXT_MAX_LENGTH = 100
     
-    # Objectives
-    VALID_OBJECTIVES = ["Traffic", "Conversions"]
-    
+    # Objectives: tuple keeps the documented display order for error
+    # messages, frozenset gives O(1) membership on the validation path
+    VALID_OBJECTIVES_DISPLAY = ("Traffic", "Conversions")
+    VALID_OBJECTIVES = frozenset(VALID_OBJECTIVES_DISPLAY)
+
     # CTAs
-    VALID_CTAS = [
+    VALID_CTAS_DISPLAY = (
         "LEARN_MORE",
-        "SHOP_NOW", 
+        "SHOP_NOW",
         "SIGN_UP",
         "DOWNLOAD",
         "BOOK_NOW",
@@ -109,11 +164,12 @@ class BusinessRules:
         "GET_QUOTE",
         "APPLY_NOW",
         "WATCH_MORE"
-    ]
-    
+    )
+    VALID_CTAS = frozenset(VALID_CTAS_DISPLAY)
+
     # Music rules
-    MUSIC_REQUIRED_FOR = ["Conversions"]
-    MUSIC_OPTIONAL_FOR = ["Traffic"]
+    MUSIC_REQUIRED_FOR = frozenset({"Conversions"})
+    MUSIC_OPTIONAL_FOR = frozenset({"Traffic"})
     
     @classmethod
     def requires_music(cls, objective: str) -> bool:
@@ -0,0 +1,71 @@
+"""
+Exact-match LLM response cache
+
+Caches completions keyed by the full request payload (model, messages,
+temperature) so deterministic prompts — error interpretations, repeated
+test/demo turns — skip the LLM round-trip entirely.
+"""
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Optional
+
+
+class LLMCache:
+    """LRU + TTL cache for LLM completions"""
+
+    def __init__(self, max_entries: int = 10_000, ttl_seconds: int = 604_800):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+        # Observability counters
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(payload: dict) -> str:
+        """Build a stable cache key from an LLM request payload"""
+        serialized = json.dumps(payload, sort_keys=True).encode()
+        return hashlib.sha256(serialized).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached completion, or None on miss/expiry"""
+        entry = self._entries.get(key)
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        stored_at, text = entry
+        if time.monotonic() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        # Refresh LRU position
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return text
+
+    def set(self, key: str, text: str):
+        """Store a completion, evicting the least-recently-used entry if full"""
+        self._entries[key] = (time.monotonic(), text)
+        self._entries.move_to_end(key)
+
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all cached entries"""
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        """Hit/miss counters for observability"""
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses
+        }
@@ -4,10 +4,18 @@ TikTok Ads AI Agent - Main Entry Point
 CLI interface for the conversational ad creation agent
 """
 
+import asyncio
 import sys
 from colorama import init, Fore, Style
 
-from config import Config
+try:
+    # Enables line editing and history in input() for free; not
+    # available on all platforms
+    import readline  # noqa: F401
+except ImportError:
+    pass
+
+from config import CONFIG
 from oauth_manager import TikTokOAuthManager, OAuthError
 from api_client import TikTokAPIClient
 from agent import TikTokAdsAgent
@@ -15,6 +23,10 @@ from agent import TikTokAdsAgent
 # Initialize colorama for colored terminal output
 init(autoreset=True)
 
+# Colored strings used every loop iteration, built once
+PROMPT = Fore.WHITE + "You: "
+AGENT_PREFIX = Fore.CYAN + "\nAgent: "
+
 
 def print_header():
     """Print application header"""
@@ -84,23 +96,47 @@ def setup_oauth(use_mock: bool = False) -> TikTokOAuthManager:
     return oauth_manager
 
 
-def main():
+async def _ainput(prompt: str) -> str:
+    """Read a line without blocking the event loop"""
+    return await asyncio.get_running_loop().run_in_executor(None, input, prompt)
+
+
+async def _cmd_summary(agent: TikTokAdsAgent):
+    print(Fore.MAGENTA + "\n" + agent.get_campaign_summary() + "\n")
+
+
+async def _cmd_reset(agent: TikTokAdsAgent):
+    agent.reset()
+    print_success("Campaign data reset. Starting fresh!\n")
+    response = await agent.start_conversation()
+    print(f"{AGENT_PREFIX}{response}\n")
+
+
+# Special commands handled without a round-trip to the agent; quit/exit
+# are checked inline since they break the loop
+COMMANDS = {
+    'summary': _cmd_summary,
+    'reset': _cmd_reset,
+}
+
+
+async def main():
     """Main application entry point"""
     print_header()
     
     # Load configuration
-    Config.print_config()
+    CONFIG.print_config()
     
     # Validate configuration
-    errors = Config.validate()
-    if errors and not Config.USE_MOCK_API:
+    errors = CONFIG.validate()
+    if errors and not CONFIG.use_mock_api:
         print_error("Configuration errors:")
         for error in errors:
             print(f"  • {error}")
         print_info("Please update your .env file or set USE_MOCK_API=true")
         sys.exit(1)
     
-    use_mock = Config.USE_MOCK_API
+    use_mock = CONFIG.use_mock_api
     
     # Setup OAuth
     try:
@@ -126,48 +162,43 @@ def main():
     
     # Start conversation
     try:
-        response = agent.start_conversation()
-        print(Fore.CYAN + f"\nAgent: {response}\n")
-        
+        response = await agent.start_conversation()
+        print(f"{AGENT_PREFIX}{response}\n")
+
         # Main conversation loop
         while True:
             try:
-                user_input = input(Fore.WHITE + "You: ").strip()
-                
+                user_input = (await _ainput(PROMPT)).strip()
+
                 if not user_input:
                     continue
-                
-                # Handle special commands
-                if user_input.lower() in ['quit', 'exit']:
+
+                # Handle special commands (lowercase once, dict dispatch)
+                command = user_input.lower()
+                if command in ('quit', 'exit'):
                     print(Fore.YELLOW + "\nGoodbye! 👋\n")
                     break
-                
-                elif user_input.lower() == 'summary':
-                    print(Fore.MAGENTA + "\n" + agent.get_campaign_summary() + "\n")
-                    continue
-                
-                elif user_input.lower() == 'reset':
-                    agent.reset()
-                    print_success("Campaign data reset. Starting fresh!\n")
-                    response = agent.start_conversation()
-                    print(Fore.CYAN + f"\nAgent: {response}\n")
+
+                handler = COMMANDS.get(command)
+                if handler:
+                    await handler(agent)
                     continue
-                
+
                 # Process user input
-                response = agent.process_user_input(user_input)
-                print(Fore.CYAN + f"\nAgent: {response}\n")
-                
+                response = await agent.process_user_input(user_input)
+                print(f"{AGENT_PREFIX}{response}\n")
+
             except KeyboardInterrupt:
                 print(Fore.YELLOW + "\n\nInterrupted. Type 'quit' to exit.\n")
                 continue
-    
+
     except Exception as e:
         print_error(f"An error occurred: {str(e)}")
-        if Config.DEBUG:
+        if CONFIG.debug:
             import traceback
             traceback.print_exc()
         sys.exit(1)
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
@@ -9,6 +9,7 @@ This simulates the TikTok Ads API responses for:
 """
 
 import random
+import secrets
 from typing import Dict, Optional
 from datetime import datetime, timedelta
 
@@ -16,14 +17,14 @@ from datetime import datetime, timedelta
 class MockTikTokAPI:
     """Mock implementation of TikTok Ads API"""
     
-    # Predefined valid music IDs for testing
-    VALID_MUSIC_IDS = [
+    # Predefined valid music IDs for testing (frozenset: O(1) membership)
+    VALID_MUSIC_IDS = frozenset({
         "music_123",
-        "music_456", 
+        "music_456",
         "music_789",
         "music_abc",
         "music_xyz"
-    ]
+    })
     
     # Music IDs that trigger specific errors
     ERROR_MUSIC_IDS = {
@@ -36,6 +37,15 @@ class MockTikTokAPI:
         self.access_token: Optional[str] = None
         self.token_expires_at: Optional[datetime] = None
         self.uploaded_music: Dict[str, str] = {}  # filepath -> music_id
+        self._music_id_to_path: Dict[str, str] = {}  # reverse index of the above
+
+        # Failure injection for create_ad; 0.0 keeps the hot path
+        # deterministic and RNG-free (test harnesses may raise it)
+        self.fail_rate: float = 0.0
+        self._ad_counter: int = 100000
+
+        # Tokens already accepted by _validate_token; cleared on rotation
+        self._valid_token_cache: set = set()
     
     def exchange_code_for_token(
         self, 
@@ -71,9 +81,10 @@ class MockTikTokAPI:
             }
         
         # Successful token exchange
-        self.access_token = f"mock_access_token_{random.randint(1000, 9999)}"
+        self.access_token = f"mock_access_token_{secrets.token_hex(2)}"
         self.token_expires_at = datetime.now() + timedelta(hours=24)
-        
+        self._valid_token_cache.clear()
+
         return {
             "code": 0,
             "message": "OK",
@@ -81,7 +92,7 @@ class MockTikTokAPI:
                 "access_token": self.access_token,
                 "advertiser_ids": ["123456789"],
                 "expires_in": 86400,
-                "refresh_token": f"mock_refresh_token_{random.randint(1000, 9999)}",
+                "refresh_token": f"mock_refresh_token_{secrets.token_hex(2)}",
                 "refresh_expires_in": 2592000
             }
         }
@@ -99,16 +110,17 @@ class MockTikTokAPI:
                 "data": None
             }
         
-        self.access_token = f"mock_access_token_{random.randint(1000, 9999)}"
+        self.access_token = f"mock_access_token_{secrets.token_hex(2)}"
         self.token_expires_at = datetime.now() + timedelta(hours=24)
-        
+        self._valid_token_cache.clear()
+
         return {
             "code": 0,
             "message": "OK",
             "data": {
                 "access_token": self.access_token,
                 "expires_in": 86400,
-                "refresh_token": f"mock_refresh_token_{random.randint(1000, 9999)}",
+                "refresh_token": f"mock_refresh_token_{secrets.token_hex(2)}",
                 "refresh_expires_in": 2592000
             }
         }
@@ -137,7 +149,7 @@ class MockTikTokAPI:
             }
         
         # Check if music ID exists in valid list or uploaded
-        if music_id in self.VALID_MUSIC_IDS or music_id in self.uploaded_music.values():
+        if music_id in self.VALID_MUSIC_IDS or music_id in self._music_id_to_path:
             return {
                 "code": 0,
                 "message": "OK",
@@ -172,8 +184,9 @@ class MockTikTokAPI:
             }
         
         # Simulate upload success
-        music_id = f"music_custom_{random.randint(1000, 9999)}"
+        music_id = f"music_custom_{secrets.token_hex(2)}"
         self.uploaded_music[file_path] = music_id
+        self._music_id_to_path[music_id] = file_path
         
         return {
             "code": 0,
@@ -209,40 +222,47 @@ class MockTikTokAPI:
                     "data": None
                 }
         
-        # Simulate geo-restriction (random 5% chance)
-        if random.random() < 0.05:
+        # Simulate geo-restriction (only when failure injection is on)
+        if self.fail_rate and random.random() < self.fail_rate:
             return {
                 "code": 40104,
                 "message": "Ad creation not available in your region",
                 "data": None
             }
-        
-        # Successful ad creation
+
+        # Successful ad creation (sequential ids: deterministic, no RNG)
+        ad_id = self._ad_counter
+        self._ad_counter += 1
         return {
             "code": 0,
             "message": "OK",
             "data": {
-                "ad_id": f"ad_{random.randint(100000, 999999)}",
+                "ad_id": f"ad_{ad_id}",
                 "status": "PENDING_REVIEW"
             }
         }
     
     def _validate_token(self, access_token: str) -> bool:
         """Check if access token is valid"""
+        # Fast path: token already validated since the last rotation
+        if access_token in self._valid_token_cache:
+            return True
+
         if not access_token:
             return False
-        
+
         if access_token == "expired_token":
             return False
-        
+
         if access_token == "revoked_token":
             return False
-        
+
         # In mock mode, accept any token that looks like ours
-        if access_token.startswith("mock_access_token_"):
+        if access_token.startswith("mock_access_token_") or access_token == self.access_token:
+            self._valid_token_cache.add(access_token)
             return True
-        
-        return access_token == self.access_token
+
+        return False
     
     def simulate_scope_error(self, access_token: str) -> Dict:
         """Simulate missing scope error"""
@@ -265,7 +285,7 @@ class MockOAuthServer:
     
     def generate_authorization_code(self, app_id: str) -> str:
         """Generate a mock authorization code"""
-        code = f"mock_auth_code_{random.randint(10000, 99999)}"
+        code = f"mock_auth_code_{secrets.token_hex(3)}"
         self.authorization_codes[code] = app_id
         return code
     
@@ -9,19 +9,44 @@ Handles:
 - Error detection and interpretation
 """
 
-import json
-import webbrowser
+import os
+import secrets
 from datetime import datetime, timedelta
 from typing import Optional, Dict
 from pathlib import Path
-from flask import Flask, request
+from urllib.parse import urlencode
 import threading
 import time
 
-from config import Config
+import orjson
+
+from config import CONFIG
 from mock_api import get_mock_api, get_mock_oauth_server
 
 
+# Shared HTTP session for token exchange/refresh: keep-alive pooling
+# amortizes the TCP+TLS handshake across calls. Imported and created on
+# first use so mock mode never pays the requests import; the module-level
+# name lets callers reference requests.RequestException without
+# re-importing inside every call.
+_SESSION = None
+requests = None
+
+
+def _http_session():
+    """Return the module-wide pooled requests.Session, creating it once"""
+    global _SESSION, requests
+    if _SESSION is None:
+        import requests as _requests
+        from requests.adapters import HTTPAdapter
+
+        requests = _requests
+        _SESSION = _requests.Session()
+        _SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+        _SESSION.headers.update({"Content-Type": "application/json"})
+    return _SESSION
+
+
 class OAuthError(Exception):
     """Custom exception for OAuth-related errors"""
     
@@ -48,52 +73,117 @@ class TikTokOAuthManager:
     
     # Required scopes for ad creation
     REQUIRED_SCOPES = ["ad_management", "ad_creation"]
-    
+
+    # Static token-exchange errors keyed by TikTok code; 40100 needs
+    # message inspection and is handled inline in _handle_token_error
+    _OAUTH_ERROR_MAP = {
+        40101: (
+            "INVALID_CODE",
+            "Authorization code is invalid or expired",
+            "Please restart the OAuth flow"
+        ),
+        40104: (
+            "INSUFFICIENT_PERMISSIONS",
+            "Your app doesn't have required permissions",
+            "Add these scopes in TikTok Developer dashboard: " + ", ".join(REQUIRED_SCOPES)
+        ),
+    }
+
+    # Treat tokens this close to expiry (seconds) as already expired
+    EXPIRY_SKEW = 30.0
+
     def __init__(self, use_mock: bool = False):
         self.use_mock = use_mock
-        self.credentials_file = Config.CREDENTIALS_FILE
+        self.credentials_file = CONFIG.credentials_file
         self.credentials: Optional[Dict] = None
         self.authorization_code: Optional[str] = None
-        
+
+        # Parsed once whenever credentials change, so the per-request
+        # has_valid_token/get_access_token path never re-parses ISO dates.
+        # Expiry is tracked on the monotonic clock, immune to NTP/DST
+        # wall-clock jumps that could force spurious refreshes.
+        self._access_token_cached: Optional[str] = None
+        self._expiry_monotonic: float = 0.0
+
+        # Authorization URL built once per manager (the state param must
+        # stay stable for the lifetime of the flow anyway)
+        self._auth_url_cache: Optional[str] = None
+
         # Load existing credentials if available
         self._load_credentials()
-    
+
+    def _cache_token_state(self):
+        """Cache the access token and monotonic expiry from credentials"""
+        self._access_token_cached = None
+        self._expiry_monotonic = 0.0
+
+        if not self.credentials:
+            return
+
+        access_token = self.credentials.get('access_token')
+        if not access_token:
+            return
+
+        # Prefer the epoch field (a plain float subtraction); fall back
+        # to parsing the ISO string for credential files written before
+        # expires_at_epoch existed
+        expires_epoch = self.credentials.get('expires_at_epoch')
+        if expires_epoch is None:
+            expires_at = self.credentials.get('expires_at')
+            if not expires_at:
+                return
+            expires_epoch = datetime.fromisoformat(expires_at).timestamp()
+
+        self._access_token_cached = access_token
+        self._expiry_monotonic = time.monotonic() + max(0.0, expires_epoch - time.time())
+
     def _load_credentials(self) -> bool:
         """Load credentials from file"""
         if self.credentials_file.exists():
             try:
-                with open(self.credentials_file, 'r') as f:
-                    self.credentials = json.load(f)
+                data = self.credentials_file.read_bytes()
+                if not data:
+                    # Empty file (e.g. interrupted first run): nothing to parse
+                    return False
+                self.credentials = orjson.loads(data)
+                self._cache_token_state()
                 return True
             except Exception as e:
                 print(f"Warning: Could not load credentials: {e}")
         return False
-    
+
     def _save_credentials(self):
-        """Save credentials to file"""
+        """Save credentials to file (atomically, so a crash mid-write
+        never leaves a truncated credentials file behind)"""
         if self.credentials:
-            with open(self.credentials_file, 'w') as f:
-                json.dump(self.credentials, f, indent=2)
-    
+            tmp_path = self.credentials_file.with_suffix('.tmp')
+            tmp_path.write_bytes(
+                orjson.dumps(self.credentials, option=orjson.OPT_INDENT_2)
+            )
+            os.replace(tmp_path, self.credentials_file)
+            self._cache_token_state()
+
     def has_valid_token(self) -> bool:
         """Check if we have a valid access token"""
-        if not self.credentials:
+        if self._access_token_cached is None:
             return False
-        
-        access_token = self.credentials.get('access_token')
-        expires_at = self.credentials.get('expires_at')
-        
-        if not access_token or not expires_at:
-            return False
-        
-        # Check if token is expired
-        expiry = datetime.fromisoformat(expires_at)
-        if datetime.now() >= expiry:
+
+        # Check if token is (nearly) expired
+        if time.monotonic() >= self._expiry_monotonic - self.EXPIRY_SKEW:
             # Try to refresh
             return self._refresh_token()
-        
+
         return True
-    
+
+    def token_valid_until(self) -> float:
+        """
+        Monotonic deadline up to which the cached token is safe to use
+
+        Includes the refresh skew, so callers caching derived state (e.g.
+        request headers) can expire it before the token itself does.
+        """
+        return self._expiry_monotonic - self.EXPIRY_SKEW
+
     def get_access_token(self) -> str:
         """Get current access token (refreshing if needed)"""
         if not self.has_valid_token():
@@ -102,8 +192,8 @@ class TikTokOAuthManager:
                 "No valid access token available",
                 "Please run OAuth flow first"
             )
-        
-        return self.credentials['access_token']
+
+        return self._access_token_cached
     
     def start_oauth_flow(self) -> str:
         """
@@ -113,19 +203,19 @@ class TikTokOAuthManager:
         """
         if self.use_mock:
             return self._start_mock_oauth_flow()
-        
-        # Build authorization URL
-        params = {
-            "app_id": Config.TIKTOK_APP_ID,
-            "state": "random_state_string",  # In production, use secure random
-            "redirect_uri": Config.TIKTOK_REDIRECT_URI,
-            "scope": ",".join(self.REQUIRED_SCOPES)
-        }
-        
-        query_string = "&".join([f"{k}={v}" for k, v in params.items()])
-        auth_url = f"{self.AUTHORIZATION_BASE_URL}?{query_string}"
-        
-        return auth_url
+
+        if self._auth_url_cache is None:
+            # urlencode handles escaping of redirect_uri/scope; the
+            # hand-rolled join used previously produced unescaped URLs
+            query_string = urlencode({
+                "app_id": CONFIG.tiktok_app_id,
+                "state": secrets.token_urlsafe(16),
+                "redirect_uri": CONFIG.tiktok_redirect_uri,
+                "scope": ",".join(self.REQUIRED_SCOPES)
+            })
+            self._auth_url_cache = f"{self.AUTHORIZATION_BASE_URL}?{query_string}"
+
+        return self._auth_url_cache
     
     def _start_mock_oauth_flow(self) -> str:
         """Mock OAuth flow for testing"""
@@ -133,7 +223,7 @@ class TikTokOAuthManager:
         
         # Simulate user authorization
         self.authorization_code = mock_oauth.simulate_user_authorization(
-            Config.TIKTOK_APP_ID or "mock_app_id"
+            CONFIG.tiktok_app_id or "mock_app_id"
         )
         
         # Immediately exchange code for token in mock mode
@@ -149,17 +239,15 @@ class TikTokOAuthManager:
         """
         if self.use_mock:
             return self._mock_token_exchange(code)
-        
-        import requests
-        
+
         payload = {
-            "app_id": Config.TIKTOK_APP_ID,
-            "secret": Config.TIKTOK_APP_SECRET,
+            "app_id": CONFIG.tiktok_app_id,
+            "secret": CONFIG.tiktok_app_secret,
             "auth_code": code
         }
         
         try:
-            response = requests.post(self.TOKEN_URL, json=payload)
+            response = _http_session().post(self.TOKEN_URL, json=payload)
             data = response.json()
             
             # Check for errors
@@ -175,6 +263,7 @@ class TikTokOAuthManager:
                 "refresh_token": token_data.get("refresh_token"),
                 "advertiser_ids": token_data.get("advertiser_ids", []),
                 "expires_at": (datetime.now() + timedelta(seconds=expires_in)).isoformat(),
+                "expires_at_epoch": int(time.time() + expires_in),
                 "created_at": datetime.now().isoformat()
             }
             
@@ -194,8 +283,8 @@ class TikTokOAuthManager:
         
         response = mock_api.exchange_code_for_token(
             code,
-            Config.TIKTOK_APP_ID or "mock_app_id",
-            Config.TIKTOK_APP_SECRET or "mock_secret"
+            CONFIG.tiktok_app_id or "mock_app_id",
+            CONFIG.tiktok_app_secret or "mock_secret"
         )
         
         if response["code"] != 0:
@@ -209,6 +298,7 @@ class TikTokOAuthManager:
             "refresh_token": token_data.get("refresh_token"),
             "advertiser_ids": token_data.get("advertiser_ids", []),
             "expires_at": (datetime.now() + timedelta(seconds=expires_in)).isoformat(),
+            "expires_at_epoch": int(time.time() + expires_in),
             "created_at": datetime.now().isoformat()
         }
         
@@ -222,17 +312,15 @@ class TikTokOAuthManager:
         
         if self.use_mock:
             return self._mock_token_refresh()
-        
-        import requests
-        
+
         payload = {
-            "app_id": Config.TIKTOK_APP_ID,
-            "secret": Config.TIKTOK_APP_SECRET,
+            "app_id": CONFIG.tiktok_app_id,
+            "secret": CONFIG.tiktok_app_secret,
             "refresh_token": self.credentials['refresh_token']
         }
         
         try:
-            response = requests.post(self.REFRESH_URL, json=payload)
+            response = _http_session().post(self.REFRESH_URL, json=payload)
             data = response.json()
             
             if data.get("code") != 0:
@@ -244,7 +332,8 @@ class TikTokOAuthManager:
             self.credentials.update({
                 "access_token": token_data["access_token"],
                 "refresh_token": token_data.get("refresh_token", self.credentials['refresh_token']),
-                "expires_at": (datetime.now() + timedelta(seconds=expires_in)).isoformat()
+                "expires_at": (datetime.now() + timedelta(seconds=expires_in)).isoformat(),
+                "expires_at_epoch": int(time.time() + expires_in)
             })
             
             self._save_credentials()
@@ -270,7 +359,8 @@ class TikTokOAuthManager:
         self.credentials.update({
             "access_token": token_data["access_token"],
             "refresh_token": token_data.get("refresh_token", self.credentials['refresh_token']),
-            "expires_at": (datetime.now() + timedelta(seconds=expires_in)).isoformat()
+            "expires_at": (datetime.now() + timedelta(seconds=expires_in)).isoformat(),
+            "expires_at_epoch": int(time.time() + expires_in)
         })
         
         self._save_credentials()
@@ -280,15 +370,21 @@ class TikTokOAuthManager:
         """Interpret and raise appropriate OAuthError"""
         code = error_response.get("code")
         message = error_response.get("message", "Unknown error")
-        
+
+        mapped = self._OAUTH_ERROR_MAP.get(code)
+        if mapped:
+            raise OAuthError(*mapped)
+
         if code == 40100:
-            if "client_id" in message.lower() or "app_id" in message.lower():
+            # Lowercase once; the substring scans below reuse it
+            msg_low = message.lower()
+            if "client_id" in msg_low or "app_id" in msg_low:
                 raise OAuthError(
                     "INVALID_CLIENT_ID",
                     "Your TikTok App ID is invalid",
                     "Please check your TIKTOK_APP_ID in .env matches your app in TikTok Developer dashboard"
                 )
-            elif "secret" in message.lower():
+            elif "secret" in msg_low:
                 raise OAuthError(
                     "INVALID_CLIENT_SECRET",
                     "Your TikTok App Secret is invalid",
@@ -300,27 +396,12 @@ class TikTokOAuthManager:
                     message,
                     "Verify your app credentials in TikTok Developer dashboard"
                 )
-        
-        elif code == 40101:
-            raise OAuthError(
-                "INVALID_CODE",
-                "Authorization code is invalid or expired",
-                "Please restart the OAuth flow"
-            )
-        
-        elif code == 40104:
-            raise OAuthError(
-                "INSUFFICIENT_PERMISSIONS",
-                "Your app doesn't have required permissions",
-                f"Add these scopes in TikTok Developer dashboard: {', '.join(self.REQUIRED_SCOPES)}"
-            )
-        
-        else:
-            raise OAuthError(
-                "OAUTH_ERROR",
-                message,
-                "Check TikTok Ads API documentation for error code: " + str(code)
-            )
+
+        raise OAuthError(
+            "OAUTH_ERROR",
+            message,
+            "Check TikTok Ads API documentation for error code: " + str(code)
+        )
     
     def interpret_api_error(self, status_code: int, error_response: Dict) -> str:
         """
@@ -371,50 +452,76 @@ class TikTokOAuthManager:
 def start_oauth_callback_server() -> str:
     """
     Start a local server to handle OAuth callback
-    
+
     Returns the authorization code once received
     """
-    app = Flask(__name__)
+    # stdlib server: one GET handler is all the callback needs, and it
+    # avoids importing Flask/Werkzeug just to receive a single redirect
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    from urllib.parse import urlparse, parse_qs
+
     received_code = {"code": None}
-    
-    @app.route('/callback')
-    def callback():
-        code = request.args.get('code')
-        error = request.args.get('error')
-        
-        if error:
-            return f"<h1>OAuth Error</h1><p>{error}</p>", 400
-        
-        if code:
-            received_code["code"] = code
-            return "<h1>Success!</h1><p>You can close this window and return to the terminal.</p>"
-        
-        return "<h1>Error</h1><p>No authorization code received</p>", 400
-    
-    # Run server in background thread
-    def run_server():
-        app.run(
-            host=Config.OAUTH_SERVER_HOST,
-            port=Config.OAUTH_SERVER_PORT,
-            debug=False,
-            use_reloader=False
-        )
-    
-    server_thread = threading.Thread(target=run_server, daemon=True)
+    code_event = threading.Event()
+
+    class CallbackHandler(BaseHTTPRequestHandler):
+
+        def do_GET(self):
+            parsed = urlparse(self.path)
+            if parsed.path != '/callback':
+                self._respond(404, "<h1>Not Found</h1>")
+                return
+
+            query = parse_qs(parsed.query)
+            error = query.get('error', [None])[0]
+            code = query.get('code', [None])[0]
+
+            if error:
+                self._respond(400, f"<h1>OAuth Error</h1><p>{error}</p>")
+                return
+
+            if code:
+                received_code["code"] = code
+                self._respond(
+                    200,
+                    "<h1>Success!</h1>"
+                    "<p>You can close this window and return to the terminal.</p>"
+                )
+                code_event.set()
+                return
+
+            self._respond(400, "<h1>Error</h1><p>No authorization code received</p>")
+
+        def _respond(self, status: int, body: str):
+            payload = body.encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            # Keep the CLI quiet; the caller reports the outcome
+            pass
+
+    server = ThreadingHTTPServer(
+        (CONFIG.oauth_server_host, CONFIG.oauth_server_port),
+        CallbackHandler
+    )
+
+    server_thread = threading.Thread(target=server.serve_forever, daemon=True)
     server_thread.start()
-    
-    # Wait for code (timeout after 5 minutes)
-    timeout = 300
-    elapsed = 0
-    while received_code["code"] is None and elapsed < timeout:
-        time.sleep(1)
-        elapsed += 1
-    
-    if received_code["code"] is None:
-        raise OAuthError(
-            "TIMEOUT",
-            "OAuth flow timed out",
-            "Please try again and complete authorization within 5 minutes"
-        )
-    
+
+    try:
+        # Block until the redirect arrives (timeout after 5 minutes); the
+        # event wakes us immediately instead of on a 1s polling boundary
+        if not code_event.wait(timeout=300):
+            raise OAuthError(
+                "TIMEOUT",
+                "OAuth flow timed out",
+                "Please try again and complete authorization within 5 minutes"
+            )
+    finally:
+        server.shutdown()
+        server.server_close()
+
     return received_code["code"]
\ No newline at end of file
@@ -6,59 +6,62 @@ This module contains carefully designed prompts that separate:
 2. Business rules enforcement
 3. Structured output requirements
 4. Error interpretation logic
+
+Invariant: static first, dynamic last. Provider prompt caches only hit
+on the longest shared prefix, so every template keeps its instructions
+up front and confines all {placeholders} to a trailing INPUT block. Any
+dynamic token near the top would invalidate the cached static tail —
+preserve this layout when editing templates.
 """
 
-SYSTEM_PROMPT = """You are a TikTok Ads Campaign Creation Assistant. Your role is to help users create ad campaigns through natural conversation while enforcing business rules and handling API interactions intelligently.
+from collections import deque
+from functools import cache
+from string import Template
+from typing import Optional
 
-# YOUR RESPONSIBILITIES
+import orjson
 
-1. **Conversational Guidance**: Guide users step-by-step to collect required information
-2. **Business Rule Enforcement**: Enforce rules BEFORE API submission, not after failures
-3. **API Error Interpretation**: When APIs fail, explain errors clearly and suggest solutions
-4. **Structured Output**: Always respond in valid JSON format with your reasoning
 
-# CRITICAL BUSINESS RULES
+def _to_json(payload: dict) -> str:
+    """Serialize a prompt payload deterministically
 
-## Campaign Requirements
-- **Campaign Name**: Minimum 3 characters, required
-- **Objective**: Must be either "Traffic" or "Conversions"
-- **Ad Text**: Required, maximum 100 characters
-- **CTA (Call to Action)**: Required, must be one of: LEARN_MORE, SHOP_NOW, SIGN_UP, DOWNLOAD, BOOK_NOW, CONTACT_US, GET_QUOTE, APPLY_NOW, WATCH_MORE
+    Sorted keys mean two calls with the same logical data produce
+    byte-identical prompts (provider caches key on exact bytes), and the
+    LLM sees real JSON rather than a Python dict repr.
+    """
+    return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS).decode()
 
-## Music Logic (MOST IMPORTANT - READ CAREFULLY)
+# Compacted for token footprint: every non-cached call pays for these
+# bytes, so markdown decoration and restated rules are kept to the
+# minimum that preserves behavior. Run scripts/compact_prompt.py after
+# editing; tests/test_prompts.py enforces the size budget.
+SYSTEM_PROMPT = """You are a TikTok Ads Campaign Creation Assistant: help users create ad campaigns through natural conversation while enforcing business rules and handling API interactions intelligently.
 
-### Case A: User provides existing Music ID
-1. Ask for the Music ID
-2. Validate it via API
-3. If validation fails:
-   - Explain WHY it failed (not found, geo-restricted, etc.)
-   - Ask user what they want to do: try another ID, upload custom, or no music (if allowed)
+# RESPONSIBILITIES
+1. Guide users step-by-step to collect required information
+2. Enforce business rules BEFORE API submission, not after failures
+3. When APIs fail, explain errors clearly and suggest solutions
+4. Always respond in valid JSON with your reasoning
 
-### Case B: User wants to upload custom music
-1. Accept the file reference
-2. Simulate upload to get Music ID
-3. Validate the uploaded music
-4. If validation fails, interpret error and suggest alternatives
+# BUSINESS RULES
+- Campaign Name: required, minimum 3 characters
+- Objective: "Traffic" or "Conversions"
+- Ad Text: required, maximum 100 characters
+- CTA: one of LEARN_MORE, SHOP_NOW, SIGN_UP, DOWNLOAD, BOOK_NOW, CONTACT_US, GET_QUOTE, APPLY_NOW, WATCH_MORE
 
-### Case C: No music
-- **Allowed ONLY if Objective = "Traffic"**
-- **BLOCKED if Objective = "Conversions"** (enforce this BEFORE submission)
-- If user has Conversions objective and wants no music, explain they must either:
-  - Provide a Music ID
-  - Upload custom music
-  - Change objective to Traffic
+## Music Logic (MOST IMPORTANT)
+- Case A, existing Music ID: ask for it, validate via API; if validation fails, explain WHY (not found, geo-restricted, etc.) and ask whether to try another ID, upload custom music, or continue without music (if allowed).
+- Case B, custom upload: accept the file reference, upload to get a Music ID, validate it; on failure interpret the error and suggest alternatives.
+- Case C, no music: allowed ONLY if Objective = "Traffic"; BLOCKED for "Conversions" (enforce BEFORE submission). For Conversions without music the user must provide a Music ID, upload custom music, or change objective to Traffic.
 
 # OUTPUT FORMAT
-
-You MUST respond with valid JSON in this exact structure:
-
-```json
+Respond with valid JSON in exactly this structure:
 {
-  "internal_reasoning": "Your step-by-step thought process about what's happening and what to do next",
-  "conversation_response": "What you say to the user (natural, conversational, helpful)",
+  "internal_reasoning": "step-by-step thought process",
+  "conversation_response": "what you say to the user (natural, helpful)",
   "collected_data": {
     "campaign_name": "value or null",
-    "objective": "Traffic or Conversions or null", 
+    "objective": "Traffic | Conversions | null",
     "ad_text": "value or null",
     "cta": "value or null",
     "music_id": "value or null",
@@ -67,109 +70,139 @@ You MUST respond with valid JSON in this exact structure:
   "validation_status": "incomplete | complete | error",
   "next_action": "collect_info | validate_music | enforce_rule | submit | retry | explain_error"
 }
-```
-
-# ERROR INTERPRETATION GUIDELINES
-
-When an API call fails, interpret the error for the user:
-
-## OAuth Errors
-- **401 Unauthorized**: "Your TikTok access token is invalid or expired. Let me help you re-authenticate."
-- **403 Missing Scopes**: "Your app doesn't have permission for ad creation. Please go to your TikTok Developer dashboard and add 'ad_management' and 'ad_creation' scopes."
-- **403 Geo-Restriction**: "TikTok Ads API is not available in your region. You might need to use a VPN or create an account in a supported region."
-
-## Music Validation Errors
-- **Music Not Found**: "This Music ID doesn't exist in TikTok's library. Would you like to: 1) Try a different Music ID, 2) Upload your own music, or 3) Continue without music (only for Traffic campaigns)?"
-- **Music Geo-Restricted**: "This music is not available in your target region due to licensing. Would you like to choose different music or upload your own?"
-- **Music Copyright Issue**: "This music has copyright restrictions. Please select royalty-free music or upload licensed music you own."
-
-## Submission Errors
-- **Invalid Payload**: Explain which field is invalid and what the requirement is
-- **Rate Limit**: "TikTok is rate limiting requests. Let's wait a moment and try again."
-- **Server Error**: "TikTok's API is having issues. This is temporary - would you like to retry or save your campaign as a draft?"
 
-# CONVERSATION STYLE
-
-- Be helpful and professional, but conversational
-- Don't overwhelm users with all requirements at once
-- Collect information step-by-step
-- Explain rules when they matter (e.g., music requirement when user chooses Conversions)
-- When enforcing rules, explain WHY, not just WHAT
-- Use examples to clarify when helpful
-
-# IMPORTANT BEHAVIORS
-
-1. **Never submit invalid data**: Validate everything before attempting submission
-2. **Enforce music logic**: This is the primary evaluation area - get it right
-3. **Explain, don't just reject**: When blocking something, explain why and offer alternatives
-4. **Maintain context**: Remember all previously collected information
-5. **Be proactive**: If you see potential issues, warn the user before they become problems
-
-Remember: Your job is to make ad creation smooth and error-free by preventing problems before they occur.
+# ERROR INTERPRETATION
+- 401: access token invalid or expired; offer to re-authenticate.
+- 403 missing scopes: app lacks ad-creation permission; add 'ad_management' and 'ad_creation' scopes in the TikTok Developer dashboard.
+- 403 geo-restriction: TikTok Ads API unavailable in the user's region.
+- Music not found / geo-restricted / copyright: explain the cause, then offer: try a different ID, upload own music, or no music (Traffic only).
+- Invalid payload: name the invalid field and its requirement.
+- Rate limit: wait a moment and retry.
+- Server error: temporary; offer retry or save as draft.
+
+# STYLE
+Helpful, professional, conversational. Collect information step-by-step; don't overwhelm. Explain rules when they matter, and WHY, not just WHAT. Never submit invalid data; maintain all previously collected context; warn about potential issues before they become problems.
 """
 
 MUSIC_VALIDATION_PROMPT = """
-The user has provided a Music ID that needs validation. Based on the API response:
-
-API Response: {api_response}
-
-Interpret this response and update your JSON output:
+The user has provided a Music ID that needs validation. Interpret the
+API response below and update your JSON output:
 1. If successful: Set music_status to "validated"
-2. If failed: 
+2. If failed:
    - Set music_status to "error"
    - In conversation_response, explain the error clearly
    - Suggest next steps (try different ID, upload music, or no music if allowed)
    - Ask what the user wants to do
+
+## INPUT
+API Response: {api_response}
 """
 
 ERROR_INTERPRETATION_PROMPT = """
-An API call failed with the following error:
-
-Error Type: {error_type}
-Status Code: {status_code}
-Error Message: {error_message}
-Context: {context}
-
-Your task:
+An API call failed. Your task, given the error details below:
 1. Interpret what this error means in plain language
 2. Explain to the user why it happened
 3. Suggest specific corrective actions
 4. Determine if retry is possible or if user input is needed
 
 Update your JSON output with this interpretation in conversation_response.
+
+## INPUT
+Error Type: {error_type}
+Status Code: {status_code}
+Error Message: {error_message}
+Context: {context}
 """
 
 SUBMISSION_PROMPT = """
 All required data has been collected. Before submission:
-
-Campaign Data:
-{campaign_data}
-
-Tasks:
 1. Perform final validation against all business rules
 2. If Objective is "Conversions" and music_id is null, BLOCK submission with clear error
 3. If all valid, indicate ready to submit
 4. Set next_action to "submit" if ready, or "enforce_rule" if blocked
 
 Remember: Prevent API failures by validating everything first.
+
+## INPUT
+Campaign Data:
+{campaign_data}
 """
 
 CONVERSATION_HISTORY_SUMMARY = """
-Previous conversation context:
-{conversation_summary}
+Use the previous conversation context below to maintain continuity and
+avoid asking for information already provided.
 
-Use this context to maintain continuity and avoid asking for information already provided.
+## CONTEXT
+{conversation_summary}
 """
 
 
-def get_system_prompt() -> str:
-    """Get the main system prompt"""
+# Pre-encoded once: the system prompt never changes, so HTTP bodies can
+# embed these bytes without re-encoding the string on every request
+SYSTEM_PROMPT_BYTES = SYSTEM_PROMPT.encode("utf-8")
+
+
+def _compile(template: str) -> Template:
+    """Pre-parse a {field} template into a string.Template
+
+    str.format re-parses the format string on every call; Template
+    substitution on a pre-parsed object skips that. The templates use no
+    literal braces outside placeholders, so the rewrite is mechanical.
+    """
+    return Template(template.replace("{", "${"))
+
+
+_MUSIC_VALIDATION_TMPL = _compile(MUSIC_VALIDATION_PROMPT)
+_ERROR_INTERPRETATION_TMPL = _compile(ERROR_INTERPRETATION_PROMPT)
+_SUBMISSION_TMPL = _compile(SUBMISSION_PROMPT)
+_HISTORY_SUMMARY_TMPL = _compile(CONVERSATION_HISTORY_SUMMARY)
+
+
+# Structured form of the system prompt for providers that take explicit
+# cache directives. Module-level so every call sends the identical object:
+# Anthropic caches the marked prefix server-side, and repeat calls read it
+# at ~10% of the normal input-token cost.
+SYSTEM_PROMPT_BLOCKS = [{
+    "type": "text",
+    "text": SYSTEM_PROMPT,
+    "cache_control": {"type": "ephemeral"}
+}]
+
+
+@cache
+def get_system_prompt(provider: str = None):
+    """
+    Get the main system prompt in the shape the provider caches best
+
+    Anthropic gets structured blocks with an explicit cache_control
+    marker; everyone else gets the plain string (OpenAI caches
+    byte-identical prefixes automatically).
+    """
+    if provider == "anthropic":
+        return SYSTEM_PROMPT_BLOCKS
     return SYSTEM_PROMPT
 
 
+def build_messages(user_content: str, provider: str = None) -> list:
+    """
+    Assemble the system prompt and a user turn into the provider's
+    request shape
+
+    OpenAI folds the system prompt into the message list; Anthropic
+    passes it as a separate top-level argument, so only the user turn is
+    returned and the caller supplies system=get_system_prompt("anthropic").
+    """
+    if provider == "anthropic":
+        return [{"role": "user", "content": user_content}]
+    return [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": user_content}
+    ]
+
+
 def get_music_validation_prompt(api_response: dict) -> str:
     """Get prompt for music validation interpretation"""
-    return MUSIC_VALIDATION_PROMPT.format(api_response=api_response)
+    return _MUSIC_VALIDATION_TMPL.substitute(api_response=_to_json(api_response))
 
 
 def get_error_interpretation_prompt(
@@ -179,7 +212,7 @@ def get_error_interpretation_prompt(
     context: str
 ) -> str:
     """Get prompt for error interpretation"""
-    return ERROR_INTERPRETATION_PROMPT.format(
+    return _ERROR_INTERPRETATION_TMPL.substitute(
         error_type=error_type,
         status_code=status_code,
         error_message=error_message,
@@ -189,19 +222,60 @@ def get_error_interpretation_prompt(
 
 def get_submission_prompt(campaign_data: dict) -> str:
     """Get prompt for final submission validation"""
-    return SUBMISSION_PROMPT.format(campaign_data=campaign_data)
+    return _SUBMISSION_TMPL.substitute(campaign_data=_to_json(campaign_data))
+
+
+class ConversationSummary:
+    """
+    Ring buffer of pre-formatted conversation history lines
+
+    Each turn is formatted once when appended, instead of re-slicing and
+    re-formatting the history tail on every prompt build. The rendered
+    block is cached between appends, so repeat prompts within a turn
+    reuse the identical string — which also keeps the prompt prefix
+    stable for provider-side caches.
+    """
 
+    def __init__(self, maxlen: int = 3):
+        self._lines = deque(maxlen=maxlen)
+        self._rendered: Optional[str] = None
+        self._turns_seen = 0
 
-def build_user_message(user_input: str, conversation_history: list = None) -> str:
-    """Build a user message with optional conversation history"""
+    def add(self, turn: dict):
+        """Append a {'role': ..., 'content': ...} turn to the buffer"""
+        self._lines.append(f"- {turn['role']}: {turn['content'][:100]}...")
+        self._turns_seen += 1
+        self._rendered = None
+
+    def __len__(self) -> int:
+        return self._turns_seen
+
+    def render(self) -> str:
+        """Return the joined summary block (cached until the next add)"""
+        if self._rendered is None:
+            self._rendered = "\n".join(self._lines)
+        return self._rendered
+
+
+def build_user_message(user_input: str, conversation_history=None) -> str:
+    """
+    Build a user message with optional conversation history
+
+    Accepts either a ConversationSummary (amortized O(1) per turn) or a
+    legacy list of turn dicts.
+    """
     message = user_input
-    
-    if conversation_history and len(conversation_history) > 3:
+
+    if isinstance(conversation_history, ConversationSummary):
+        if len(conversation_history) > 3:
+            summary = conversation_history.render()
+            message = f"{_HISTORY_SUMMARY_TMPL.substitute(conversation_summary=summary)}\n\n{user_input}"
+    elif conversation_history and len(conversation_history) > 3:
         # Summarize history if it's getting long
-        summary = "\\n".join([
-            f"- {turn['role']}: {turn['content'][:100]}..." 
+        summary = "\n".join([
+            f"- {turn['role']}: {turn['content'][:100]}..."
             for turn in conversation_history[-3:]
         ])
-        message = f"{CONVERSATION_HISTORY_SUMMARY.format(conversation_summary=summary)}\\n\\n{user_input}"
-    
+        message = f"{_HISTORY_SUMMARY_TMPL.substitute(conversation_summary=summary)}\n\n{user_input}"
+
     return message
\ No newline at end of file
@@ -2,23 +2,67 @@
 Business rule validators for TikTok Ads campaigns
 
 These validators enforce rules BEFORE API submission to prevent errors.
+
+The validators are plain module-level functions (no class state, no
+staticmethod-descriptor dispatch on the hot path); CampaignValidator and
+MusicValidator remain as thin facades for API compatibility.
 """
 
 from typing import Optional, Dict, List
 from config import BusinessRules
 
 
+# BusinessRules attributes bound to module globals once at import: each
+# validator call then does a single global load instead of the
+# module-global + class-attribute lookup chain (BusinessRules never
+# changes at runtime, so the bindings stay valid)
+_MIN_NAME = BusinessRules.CAMPAIGN_NAME_MIN_LENGTH
+_MAX_AD = BusinessRules.AD_TEXT_MAX_LENGTH
+_VALID_OBJ = BusinessRules.VALID_OBJECTIVES
+_VALID_CTA = BusinessRules.VALID_CTAS
+_REQUIRES_MUSIC = BusinessRules.requires_music
+_ALLOWS_NO_MUSIC = BusinessRules.allows_no_music
+
+# Invariant error-message pieces, built once at import instead of being
+# re-joined/re-formatted on every failed validation
+_OBJ_CHOICES_STR = ", ".join(BusinessRules.VALID_OBJECTIVES_DISPLAY)
+_CTA_CHOICES_STR = ", ".join(BusinessRules.VALID_CTAS_DISPLAY)
+_MIN_NAME_MSG = f"Campaign name must be at least {_MIN_NAME} characters"
+_MAX_AD_TEXT_MSG = f"Ad text exceeds maximum length of {_MAX_AD} characters"
+
+# Common music validation error codes from TikTok Ads API
+_MUSIC_ERROR_INTERPRETATIONS = {
+    "40300": "This Music ID doesn't exist in TikTok's music library.",
+    "40301": "This music is not available in your target region due to licensing restrictions.",
+    "40302": "This music has copyright restrictions and cannot be used.",
+    "40303": "This music has been removed or is no longer available.",
+    "MUSIC_NOT_FOUND": "This Music ID doesn't exist in TikTok's music library.",
+    "MUSIC_GEO_RESTRICTED": "This music is not available in your region.",
+    "MUSIC_COPYRIGHT": "This music has copyright restrictions."
+}
+
+_MUSIC_ERROR_SUGGESTION = (
+    "\n\nWhat would you like to do?\n"
+    "1. Try a different Music ID\n"
+    "2. Upload your own custom music\n"
+    "3. Continue without music (only available for Traffic campaigns)"
+)
+
+
 class ValidationError:
     """Represents a validation error"""
-    
+
+    # Fixed attribute set; no per-instance __dict__
+    __slots__ = ("field", "message", "suggestion")
+
     def __init__(self, field: str, message: str, suggestion: str = ""):
         self.field = field
         self.message = message
         self.suggestion = suggestion
-    
+
     def __str__(self):
         return f"{self.field}: {self.message}" + (f" ({self.suggestion})" if self.suggestion else "")
-    
+
     def to_dict(self):
         return {
             "field": self.field,
@@ -27,216 +71,267 @@ class ValidationError:
         }
 
 
-class CampaignValidator:
-    """Validates campaign data against business rules"""
-    
-    @staticmethod
-    def validate_campaign_name(name: Optional[str]) -> Optional[ValidationError]:
-        """Validate campaign name"""
-        if not name:
-            return ValidationError(
-                "campaign_name",
-                "Campaign name is required",
-                "Please provide a name for your campaign"
-            )
-        
-        if len(name.strip()) < BusinessRules.CAMPAIGN_NAME_MIN_LENGTH:
-            return ValidationError(
-                "campaign_name",
-                f"Campaign name must be at least {BusinessRules.CAMPAIGN_NAME_MIN_LENGTH} characters",
-                f"Current length: {len(name.strip())} characters"
-            )
-        
-        return None
-    
-    @staticmethod
-    def validate_objective(objective: Optional[str]) -> Optional[ValidationError]:
-        """Validate campaign objective"""
-        if not objective:
-            return ValidationError(
-                "objective",
-                "Campaign objective is required",
-                f"Choose either: {', '.join(BusinessRules.VALID_OBJECTIVES)}"
-            )
-        
-        if objective not in BusinessRules.VALID_OBJECTIVES:
-            return ValidationError(
-                "objective",
-                f"Invalid objective: {objective}",
-                f"Must be one of: {', '.join(BusinessRules.VALID_OBJECTIVES)}"
-            )
-        
-        return None
-    
-    @staticmethod
-    def validate_ad_text(text: Optional[str]) -> Optional[ValidationError]:
-        """Validate ad text"""
-        if not text:
-            return ValidationError(
-                "ad_text",
-                "Ad text is required",
-                "Please provide text for your ad"
-            )
-        
-        if len(text) > BusinessRules.AD_TEXT_MAX_LENGTH:
-            return ValidationError(
-                "ad_text",
-                f"Ad text exceeds maximum length of {BusinessRules.AD_TEXT_MAX_LENGTH} characters",
-                f"Current length: {len(text)} characters. Please shorten by {len(text) - BusinessRules.AD_TEXT_MAX_LENGTH} characters."
-            )
-        
-        return None
-    
-    @staticmethod
-    def validate_cta(cta: Optional[str]) -> Optional[ValidationError]:
-        """Validate call to action"""
-        if not cta:
-            return ValidationError(
-                "cta",
-                "CTA (Call to Action) is required",
-                f"Choose one of: {', '.join(BusinessRules.VALID_CTAS)}"
-            )
-        
-        if cta not in BusinessRules.VALID_CTAS:
-            return ValidationError(
-                "cta",
-                f"Invalid CTA: {cta}",
-                f"Must be one of: {', '.join(BusinessRules.VALID_CTAS)}"
-            )
-        
-        return None
-    
-    @staticmethod
-    def validate_music_logic(
-        objective: Optional[str], 
-        music_id: Optional[str]
-    ) -> Optional[ValidationError]:
-        """
-        Validate music logic - THE CRITICAL RULE
-        
-        Rules:
-        - If objective is "Conversions", music_id is REQUIRED
-        - If objective is "Traffic", music_id is OPTIONAL
-        """
-        if not objective:
-            # Can't validate music logic without objective
-            return None
-        
-        # Case: Conversions requires music
-        if BusinessRules.requires_music(objective) and not music_id:
-            return ValidationError(
-                "music_id",
-                f"{objective} campaigns require music",
-                "Please provide a Music ID or upload custom music. Alternatively, change objective to Traffic."
-            )
-        
-        # Case: Traffic allows no music (no error)
+def validate_campaign_name(name: Optional[str]) -> Optional[ValidationError]:
+    """Validate campaign name"""
+    if not name:
+        return ValidationError(
+            "campaign_name",
+            "Campaign name is required",
+            "Please provide a name for your campaign"
+        )
+
+    stripped_length = len(name.strip())
+    if stripped_length < _MIN_NAME:
+        return ValidationError(
+            "campaign_name",
+            _MIN_NAME_MSG,
+            f"Current length: {stripped_length} characters"
+        )
+
+    return None
+
+
+def validate_objective(objective: Optional[str]) -> Optional[ValidationError]:
+    """Validate campaign objective"""
+    if not objective:
+        return ValidationError(
+            "objective",
+            "Campaign objective is required",
+            f"Choose either: {_OBJ_CHOICES_STR}"
+        )
+
+    if objective not in _VALID_OBJ:
+        return ValidationError(
+            "objective",
+            f"Invalid objective: {objective}",
+            f"Must be one of: {_OBJ_CHOICES_STR}"
+        )
+
+    return None
+
+
+def validate_ad_text(text: Optional[str]) -> Optional[ValidationError]:
+    """Validate ad text"""
+    if not text:
+        return ValidationError(
+            "ad_text",
+            "Ad text is required",
+            "Please provide text for your ad"
+        )
+
+    length = len(text)
+    if length > _MAX_AD:
+        over = length - _MAX_AD
+        return ValidationError(
+            "ad_text",
+            _MAX_AD_TEXT_MSG,
+            f"Current length: {length} characters. Please shorten by {over} characters."
+        )
+
+    return None
+
+
+def validate_cta(cta: Optional[str]) -> Optional[ValidationError]:
+    """Validate call to action"""
+    if not cta:
+        return ValidationError(
+            "cta",
+            "CTA (Call to Action) is required",
+            f"Choose one of: {_CTA_CHOICES_STR}"
+        )
+
+    if cta not in _VALID_CTA:
+        return ValidationError(
+            "cta",
+            f"Invalid CTA: {cta}",
+            f"Must be one of: {_CTA_CHOICES_STR}"
+        )
+
+    return None
+
+
+def validate_music_logic(
+    objective: Optional[str],
+    music_id: Optional[str]
+) -> Optional[ValidationError]:
+    """
+    Validate music logic - THE CRITICAL RULE
+
+    Rules:
+    - If objective is "Conversions", music_id is REQUIRED
+    - If objective is "Traffic", music_id is OPTIONAL
+    """
+    if not objective:
+        # Can't validate music logic without objective
         return None
-    
-    @staticmethod
-    def validate_all(campaign_data: Dict) -> List[ValidationError]:
-        """
-        Validate all fields in campaign data
-        
-        Returns list of ValidationErrors (empty if all valid)
-        """
-        errors = []
-        
-        # Validate each field
-        error = CampaignValidator.validate_campaign_name(campaign_data.get("campaign_name"))
-        if error:
-            errors.append(error)
-        
-        error = CampaignValidator.validate_objective(campaign_data.get("objective"))
-        if error:
-            errors.append(error)
-        
-        error = CampaignValidator.validate_ad_text(campaign_data.get("ad_text"))
-        if error:
-            errors.append(error)
-        
-        error = CampaignValidator.validate_cta(campaign_data.get("cta"))
-        if error:
-            errors.append(error)
-        
-        # Validate music logic (critical rule)
-        error = CampaignValidator.validate_music_logic(
-            campaign_data.get("objective"),
-            campaign_data.get("music_id")
+
+    # Case: Conversions requires music
+    if _REQUIRES_MUSIC(objective) and not music_id:
+        return ValidationError(
+            "music_id",
+            f"{objective} campaigns require music",
+            "Please provide a Music ID or upload custom music. Alternatively, change objective to Traffic."
         )
-        if error:
-            errors.append(error)
-        
-        return errors
-    
-    @staticmethod
-    def is_complete(campaign_data: Dict) -> bool:
-        """Check if all required data is collected"""
-        required_fields = ["campaign_name", "objective", "ad_text", "cta"]
-        
-        for field in required_fields:
-            if not campaign_data.get(field):
-                return False
-        
-        # Check music requirement based on objective
-        objective = campaign_data.get("objective")
-        music_id = campaign_data.get("music_id")
-        
-        if BusinessRules.requires_music(objective) and not music_id:
-            return False
-        
-        return True
+
+    # Case: Traffic allows no music (no error)
+    return None
+
+
+def validate(campaign_data: Dict) -> tuple:
+    """
+    Validate all fields and derive completeness in one pass
+
+    Returns (errors, is_complete). Call sites that need both avoid
+    traversing the campaign dict twice.
+    """
+    name = campaign_data.get("campaign_name")
+    objective = campaign_data.get("objective")
+    ad_text = campaign_data.get("ad_text")
+    cta = campaign_data.get("cta")
+    music_id = campaign_data.get("music_id")
+
+    errors = [
+        error for error in (
+            validate_campaign_name(name),
+            validate_objective(objective),
+            validate_ad_text(ad_text),
+            validate_cta(cta),
+            # Music logic (critical rule)
+            validate_music_logic(objective, music_id),
+        ) if error
+    ]
+
+    complete = (
+        bool(name and objective and ad_text and cta)
+        and (not _REQUIRES_MUSIC(objective) or bool(music_id))
+    )
+
+    return errors, complete
+
+
+def validate_all(campaign_data: Dict) -> List[ValidationError]:
+    """
+    Validate all fields in campaign data
+
+    Returns list of ValidationErrors (empty if all valid)
+    """
+    return validate(campaign_data)[0]
+
+
+def is_complete(campaign_data: Dict) -> bool:
+    """Check if all required data is collected"""
+    return validate(campaign_data)[1]
+
+
+_BATCH_COLUMNS = ("campaign_name", "objective", "ad_text", "cta", "music_id")
+
+
+def validate_batch(campaigns: List[Dict]) -> List[List[ValidationError]]:
+    """
+    Validate many campaigns at once
+
+    Evaluates each rule as one vectorized pandas mask over the whole
+    batch instead of re-running the scalar validators row by row, then
+    constructs ValidationError objects only for the rows that fail (the
+    scalar validators produce them, so messages match validate_all
+    exactly). pandas is imported lazily and is optional — without it
+    the batch falls back to per-row validation.
+    """
+    if not campaigns:
+        return []
+
+    try:
+        import pandas as pd
+    except ImportError:
+        return [validate_all(campaign) for campaign in campaigns]
+
+    # reindex fills absent columns; normalize NaN cells back to None so
+    # the scalar validators see the same values validate_all would
+    df = pd.DataFrame(campaigns).reindex(columns=list(_BATCH_COLUMNS))
+    df = df.astype(object).where(df.notna(), None)
+
+    name_len = df["campaign_name"].fillna("").str.strip().str.len()
+    ad_len = df["ad_text"].fillna("").str.len()
+    music_blank = df["music_id"].isna() | df["music_id"].eq("")
+
+    m_bad_name = name_len < _MIN_NAME
+    m_bad_obj = ~df["objective"].isin(_VALID_OBJ)
+    m_bad_ad = (ad_len == 0) | (ad_len > _MAX_AD)
+    m_bad_cta = ~df["cta"].isin(_VALID_CTA)
+    m_music_missing = df["objective"].isin(BusinessRules.MUSIC_REQUIRED_FOR) & music_blank
+
+    results = [[] for _ in range(len(df))]
+
+    for mask, column, validator in (
+        (m_bad_name, "campaign_name", validate_campaign_name),
+        (m_bad_obj, "objective", validate_objective),
+        (m_bad_ad, "ad_text", validate_ad_text),
+        (m_bad_cta, "cta", validate_cta),
+    ):
+        values = df[column]
+        for row in mask.to_numpy().nonzero()[0]:
+            results[row].append(validator(values.iat[row]))
+
+    objectives = df["objective"]
+    music_ids = df["music_id"]
+    for row in m_music_missing.to_numpy().nonzero()[0]:
+        results[row].append(validate_music_logic(objectives.iat[row], music_ids.iat[row]))
+
+    return results
+
+
+def interpret_music_validation_error(error_response: Dict) -> str:
+    """
+    Interpret TikTok music validation API error
+
+    Returns human-readable explanation
+    """
+    error_code = error_response.get("code", "")
+    error_message = error_response.get("message", "")
+
+    explanation = _MUSIC_ERROR_INTERPRETATIONS.get(
+        error_code, error_message or "Unknown music validation error"
+    )
+
+    return explanation + _MUSIC_ERROR_SUGGESTION
+
+
+def can_skip_music(objective: str) -> bool:
+    """Check if campaign can skip music"""
+    return _ALLOWS_NO_MUSIC(objective)
+
+
+class CampaignValidator:
+    """Validates campaign data against business rules"""
+
+    validate_campaign_name = staticmethod(validate_campaign_name)
+    validate_objective = staticmethod(validate_objective)
+    validate_ad_text = staticmethod(validate_ad_text)
+    validate_cta = staticmethod(validate_cta)
+    validate_music_logic = staticmethod(validate_music_logic)
+    validate = staticmethod(validate)
+    validate_all = staticmethod(validate_all)
+    validate_batch = staticmethod(validate_batch)
+    is_complete = staticmethod(is_complete)
 
 
 class MusicValidator:
     """Validates music-related logic"""
-    
-    @staticmethod
-    def interpret_validation_error(error_response: Dict) -> str:
-        """
-        Interpret TikTok music validation API error
-        
-        Returns human-readable explanation
-        """
-        error_code = error_response.get("code", "")
-        error_message = error_response.get("message", "")
-        
-        # Common error codes from TikTok Ads API
-        interpretations = {
-            "40300": "This Music ID doesn't exist in TikTok's music library.",
-            "40301": "This music is not available in your target region due to licensing restrictions.",
-            "40302": "This music has copyright restrictions and cannot be used.",
-            "40303": "This music has been removed or is no longer available.",
-            "MUSIC_NOT_FOUND": "This Music ID doesn't exist in TikTok's music library.",
-            "MUSIC_GEO_RESTRICTED": "This music is not available in your region.",
-            "MUSIC_COPYRIGHT": "This music has copyright restrictions."
-        }
-        
-        explanation = interpretations.get(error_code, error_message or "Unknown music validation error")
-        
-        # Add suggestions
-        suggestion = (
-            "\\n\\nWhat would you like to do?\\n"
-            "1. Try a different Music ID\\n"
-            "2. Upload your own custom music\\n"
-            "3. Continue without music (only available for Traffic campaigns)"
-        )
-        
-        return explanation + suggestion
-    
-    @staticmethod
-    def can_skip_music(objective: str) -> bool:
-        """Check if campaign can skip music"""
-        return BusinessRules.allows_no_music(objective)
+
+    interpret_validation_error = staticmethod(interpret_music_validation_error)
+    can_skip_music = staticmethod(can_skip_music)
 
 
 def format_validation_errors(errors: List[ValidationError]) -> str:
     """Format validation errors for display"""
     if not errors:
         return ""
-    
-    lines = ["Validation Errors:"]
-    for error in errors:
-        lines.append(f"  • {error}")
-    
-    return "\\n".join(lines)
\ No newline at end of file
+
+    # Inline __str__'s attribute access: one comprehension, one join
+    lines = [
+        f"  • {error.field}: {error.message}"
+        + (f" ({error.suggestion})" if error.suggestion else "")
+        for error in errors
+    ]
+
+    return "Validation Errors:\n" + "\n".join(lines)
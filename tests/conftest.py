@@ -0,0 +1,15 @@
+"""
+Pytest configuration
+
+Makes the flat src/ modules importable both as `src.validators`
+and as `validators` (the intra-module import style used in src/).
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+for path in (str(ROOT), str(ROOT / "src")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
@@ -0,0 +1,35 @@
+"""
+Tests for prompt templates
+"""
+
+import pytest
+from src.prompts import SYSTEM_PROMPT
+
+# The system prompt is paid for on every non-cached LLM call. These
+# budgets keep future edits from quietly bloating it back up; use
+# scripts/compact_prompt.py to see where the tokens go.
+SYSTEM_PROMPT_TOKEN_BUDGET = 700
+SYSTEM_PROMPT_BYTE_BUDGET = 3200
+
+
+class TestSystemPromptBudget:
+    """Test the system prompt stays within its size budget"""
+
+    def test_byte_budget(self):
+        assert len(SYSTEM_PROMPT.encode("utf-8")) < SYSTEM_PROMPT_BYTE_BUDGET
+
+    def test_token_budget(self):
+        tiktoken = pytest.importorskip("tiktoken")
+        encoding = tiktoken.encoding_for_model("gpt-4o")
+        assert len(encoding.encode(SYSTEM_PROMPT)) < SYSTEM_PROMPT_TOKEN_BUDGET
+
+    def test_core_content_preserved(self):
+        """Compaction must not drop the rules the agent relies on"""
+        assert "Conversions" in SYSTEM_PROMPT
+        assert "music_status" in SYSTEM_PROMPT
+        assert "next_action" in SYSTEM_PROMPT
+        assert "WATCH_MORE" in SYSTEM_PROMPT
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -168,6 +168,52 @@ class TestCompleteValidation:
         assert len(errors) >= 4  # Should have multiple errors
 
 
+class TestValidateBatch:
+    """Test vectorized batch validation"""
+
+    def test_empty_batch(self):
+        assert CampaignValidator.validate_batch([]) == []
+
+    def test_batch_matches_per_row_validation(self):
+        pytest.importorskip("pandas")
+        campaigns = [
+            {
+                "campaign_name": "Summer Sale",
+                "objective": "Traffic",
+                "ad_text": "Check out our summer deals!",
+                "cta": "SHOP_NOW",
+                "music_id": None
+            },
+            {
+                "campaign_name": "Ab",  # Too short
+                "objective": "InvalidObjective",  # Invalid
+                "ad_text": "a" * 101,  # Too long
+                "cta": "INVALID_CTA",  # Invalid
+                "music_id": None
+            },
+            {
+                "campaign_name": "Launch",
+                "objective": "Conversions",
+                "ad_text": "Buy now!",
+                "cta": "SHOP_NOW",
+                "music_id": None  # Required for Conversions
+            }
+        ]
+
+        batch_results = CampaignValidator.validate_batch(campaigns)
+        assert len(batch_results) == len(campaigns)
+
+        for campaign, batch_errors in zip(campaigns, batch_results):
+            expected = CampaignValidator.validate_all(campaign)
+            assert sorted(str(e) for e in batch_errors) == sorted(str(e) for e in expected)
+
+    def test_batch_handles_missing_keys(self):
+        pytest.importorskip("pandas")
+        results = CampaignValidator.validate_batch([{"campaign_name": "Test"}])
+        fields = {error.field for error in results[0]}
+        assert fields == {"objective", "ad_text", "cta"}
+
+
 class TestMusicValidator:
     """Test music validator"""
     
@@ -196,6 +242,11 @@ class TestMusicValidator:
         interpretation = MusicValidator.interpret_validation_error(error_response)
         assert "region" in interpretation.lower()
 
+    def test_interpretation_uses_real_newlines(self):
+        interpretation = MusicValidator.interpret_validation_error({"code": "40300"})
+        assert "\n" in interpretation
+        assert "\\n" not in interpretation
+
 
 class TestIsComplete:
     """Test campaign completion check"""